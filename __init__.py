@@ -1,13 +1,26 @@
 """The Volcano Hybrid integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any
+from enum import IntEnum
+from statistics import NormalDist, StatisticsError, fmean, stdev
+from typing import TYPE_CHECKING, Any, Callable
 
+from homeassistant.components.bluetooth import (
+    BluetoothCallbackMatcher,
+    BluetoothChange,
+    BluetoothScanningMode,
+    BluetoothServiceInfoBleak,
+    async_register_callback,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -20,13 +33,107 @@ from .const import (
     CHAR_VOLCANO_FIRMWARE_VERSION,
     CONF_MAC_ADDRESS,
     DOMAIN,
+    EVENT_SESSION,
     PLATFORMS,
 )
 from .volcano.api import VolcanoAPI
 from .volcano.exceptions import VolcanoConnectionError
 
+if TYPE_CHECKING:
+    from .fan import VolcanoFan
+
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds a requested refresh waits, coalescing repeats, before polling
+REQUEST_REFRESH_COOLDOWN = 0.3
+
+# Dynamic update intervals in seconds
+UPDATE_INTERVAL_FAST = 1  # fan on, or heating within 10°C of target
+UPDATE_INTERVAL_ACTIVE = 2  # heating
+UPDATE_INTERVAL_COOLING = 3  # heat off but still warm
+UPDATE_INTERVAL_IDLE = 5  # cold and idle
+
+# State bits indexing _UPDATE_INTERVALS
+_STATE_HEAT_ON = 1
+_STATE_NEAR_TARGET = 2
+_STATE_BELOW_TARGET = 4
+_STATE_WARM = 8
+
+
+def _interval_for_state(state: int) -> int:
+    """Return the update interval for a combination of state bits."""
+    if state & _STATE_HEAT_ON and state & _STATE_NEAR_TARGET:
+        return UPDATE_INTERVAL_FAST
+    if state & (_STATE_HEAT_ON | _STATE_BELOW_TARGET):
+        return UPDATE_INTERVAL_ACTIVE
+    if state & _STATE_WARM:
+        return UPDATE_INTERVAL_COOLING
+    return UPDATE_INTERVAL_IDLE
+
+
+# Precomputed so the per-cycle decision is a single tuple index
+_UPDATE_INTERVALS = tuple(_interval_for_state(state) for state in range(16))
+
+# Device info (operation time) refresh cadence
+DEVICE_INFO_REFRESH_INTERVAL = timedelta(minutes=10)
+
+# Number of recent sessions kept for duration statistics
+SESSION_HISTORY_SIZE = 100
+
+# Heat-up ramp history used to place polls where the target is likely reached
+RAMP_SAMPLE_SIZE = 50
+RAMP_MIN_SAMPLES = 3
+RAMP_TARGET_TOLERANCE = 5  # °C, ramps to nearby targets are treated as comparable
+RAMP_WINDOW_QUANTILE = 0.01
+
+# Target counts as reached after this many consecutive samples within the margin
+TEMP_REACHED_MARGIN = 3  # °C
+TEMP_REACHED_CONFIRMATIONS = 3
+
+# Idle-cold backoff: poll less often the longer the device sits cold and idle
+IDLE_COLD_TEMP = 50  # °C
+IDLE_BACKOFF_AFTER_MINUTES = 5
+IDLE_BACKOFF_MAX_INTERVAL = 60  # seconds
+IDLE_WAKE_DELTA = 2  # °C change that restores normal polling
+
+# Coordinator data while the device is not connected
+DISCONNECTED_DATA: dict[str, Any] = {
+    "connected": False,
+    "current_temperature": None,
+    "target_temperature": None,
+    "heat_on": False,
+    "fan_on": False,
+}
+
+# Pending session events beyond this are dropped rather than queued unbounded
+EVENT_QUEUE_SIZE = 100
+
+
+class _SessionState(IntEnum):
+    """Heat session lifecycle tracked by the coordinator."""
+
+    IDLE = 0  # heat off
+    HEATING = 1  # heat on, target not yet reached
+    READY = 2  # heat on, target reached
+
+
+@dataclass(slots=True)
+class _SessionTracker:
+    """Per-coordinator session state touched on every update cycle."""
+
+    last_reset_ordinal: int
+    state: _SessionState = _SessionState.IDLE
+    start_time: datetime | None = None
+    start_iso: str | None = None
+    start_monotonic: float = 0.0
+    last_end_time: datetime | None = None
+    sessions_today: int = 0
+    total_sessions: int = 0
+    last_fan_state: bool = False
+    near_target_streak: int = 0
+    near_target_since: float = 0.0
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Volcano Hybrid from a config entry."""
     _LOGGER.debug("Setting up Volcano Hybrid integration")
@@ -35,14 +142,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     coordinator = VolcanoCoordinator(hass, mac_address, entry)
     
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except ConfigEntryNotReady as err:
-        await coordinator.volcano_api.disconnect()
-        raise err
+    # The BLE connection is opened lazily once the first entity subscribes
+    coordinator.data = dict(DISCONNECTED_DATA)
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
+    # Dispatch session events in the background; cancelled when the entry unloads
+    entry.async_create_background_task(
+        hass, coordinator.async_dispatch_session_events(), f"{DOMAIN} session events"
+    )
+
+    # Advertisements are watched passively so a returning device reconnects
+    # right away instead of waiting for the next poll
+    entry.async_on_unload(
+        async_register_callback(
+            hass,
+            coordinator.async_handle_advertisement,
+            BluetoothCallbackMatcher(address=mac_address, connectable=True),
+            BluetoothScanningMode.PASSIVE,
+        )
+    )
+
     # Forward the setup to the platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -70,9 +190,9 @@ class VolcanoCoordinator(DataUpdateCoordinator):
     def __init__(self, hass: HomeAssistant, mac_address: str, config_entry: ConfigEntry) -> None:
         """Initialize coordinator."""
         # Dynamic update intervals
-        self._base_update_interval = 5  # 5 seconds when idle
-        self._active_update_interval = 2  # 2 seconds when heating
-        self._fast_update_interval = 1   # 1 second when fan is on
+        self._base_update_interval = UPDATE_INTERVAL_IDLE  # 5 seconds when idle
+        self._active_update_interval = UPDATE_INTERVAL_ACTIVE  # 2 seconds when heating
+        self._fast_update_interval = UPDATE_INTERVAL_FAST   # 1 second when fan is on
         
         # Initialize with base interval
         super().__init__(
@@ -80,214 +200,429 @@ class VolcanoCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=self._base_update_interval),
+            # Delay post-command refreshes briefly so the device settles before
+            # it is read back, and collapse bursts of requests into one poll
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
         )
         self.volcano_api = VolcanoAPI(hass, mac_address)
+        self.volcano_api.set_status_update_callback(self._handle_device_notification)
         self.config_entry = config_entry
         self._mac_address = mac_address
-        
-        # Session tracking
-        self._session_start_time: datetime | None = None
-        self._last_session_end_time: datetime | None = None
-        self._session_durations: list[float] = []
-        self._sessions_today: int = 0
-        self._total_sessions: int = 0
-        self._last_reset_date = datetime.now().date()
-        
-        # Temperature tracking for events
-        self._last_temp: int | None = None
-        self._last_target_temp: int | None = None
-        self._last_fan_state: bool = False
-        self._last_heat_state: bool = False
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._mac_address)},
+        # Shared prefix for every entity unique_id on this device
+        self.uid_prefix = f"{mac_address}_"
+        # Set by the fan entity while it is added, used by the fan timer number
+        self.fan_entity: VolcanoFan | None = None
+        self._device_info: dict[str, Any] = {
+            "identifiers": {(DOMAIN, mac_address)},
             "name": "Volcano Hybrid",
             "manufacturer": "Storz & Bickel",
             "model": "Volcano Hybrid",
             "sw_version": "1.0",
         }
+        self._current_interval_s = self._base_update_interval
+        self._last_info_refresh: datetime | None = None
+        # ISO timestamp of the last successful poll, formatted once per cycle
+        self.last_update_iso: str | None = None
+        self._cached_device_info: dict[str, Any] = {}
+        self._idle_since: float | None = None
+        self._idle_temp: float | None = None
+
+        # Session events are fired by a background task, see async_dispatch_session_events
+        self._event_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(
+            maxsize=EVENT_QUEUE_SIZE
+        )
+        
+        # Session tracking, read on every update so kept in a slotted container
+        self._session = _SessionTracker(last_reset_ordinal=datetime.now().toordinal())
+        self._session_durations: deque[float] = deque(maxlen=SESSION_HISTORY_SIZE)
+        self._session_durations_sum = 0.0
+        # Rounded once when a session ends rather than on every poll
+        self._last_session_duration: float | None = None
+        self._average_session_duration: float | None = None
+
+        # Heat-up ramp tracking for adaptive polling
+        self._ramp_samples: deque[tuple[float, float]] = deque(maxlen=RAMP_SAMPLE_SIZE)
+        self._ramp_windows: dict[float, float | None] = {}
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Connect on the first subscriber and disconnect after the last one leaves."""
+        first_listener = not self._listeners
+        remove_listener = super().async_add_listener(update_callback, context)
+        if first_listener and not self.volcano_api.is_connected:
+            self.hass.async_create_task(self.async_request_refresh())
+
+        @callback
+        def remove() -> None:
+            remove_listener()
+            if not self._listeners and self.volcano_api.is_connected:
+                self.hass.async_create_task(self.volcano_api.disconnect())
 
-    def _reset_daily_stats(self) -> None:
+        return remove
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device information shared by every entity."""
+        return self._device_info
+
+    def _reset_daily_stats(self, now: datetime) -> None:
         """Reset daily statistics if it's a new day."""
-        today = datetime.now().date()
-        if today != self._last_reset_date:
-            self._sessions_today = 0
-            self._last_reset_date = today
-
-    def _handle_fan_events(self, fan_on: bool) -> None:
-        """Handle fan state changes and fire events."""
-        if fan_on != self._last_fan_state:
-            # MISSING: Update coordinator data state
-            if not hasattr(self, 'data') or self.data is None:
-                self.data = {}
-            self.data["fan_on"] = fan_on  # Add this line
-            
-            if fan_on:
-                self.hass.bus.async_fire("volcano_session_event", {
-                    "type": "fan_started",
-                    "timestamp": datetime.now().isoformat(),
-                    "session_active": self._session_start_time is not None,
-                })
-                _LOGGER.debug("Fan started")
-            else:
-                self.hass.bus.async_fire("volcano_session_event", {
-                    "type": "fan_stopped", 
-                    "timestamp": datetime.now().isoformat(),
-                    "session_active": self._session_start_time is not None,
-                })
-                _LOGGER.debug("Fan stopped")
-            
-            self._last_fan_state = fan_on
-            
-            # Force update of all entities
-            self.async_update_listeners()
+        today = now.toordinal()
+        if today != self._session.last_reset_ordinal:
+            self._session.sessions_today = 0
+            self._session.last_reset_ordinal = today
 
-    def _handle_heat_events(self, heat_on: bool) -> None:
-        """Handle heat state changes and session tracking."""
-        if heat_on != self._last_heat_state:
+    def _queue_session_event(self, event_data: dict[str, Any]) -> None:
+        """Queue a session event for the background dispatcher."""
+        try:
+            self._event_queue.put_nowait(event_data)
+        except asyncio.QueueFull:
+            _LOGGER.warning("Session event queue full, dropping %s event", event_data["type"])
+
+    async def async_dispatch_session_events(self) -> None:
+        """Fire queued session events on the bus, off the update path."""
+        while True:
+            event_data = await self._event_queue.get()
+            self.hass.bus.async_fire(EVENT_SESSION, event_data)
+            self._event_queue.task_done()
+
+    def _update_session_state(
+        self,
+        now: datetime,
+        heat_on: bool,
+        fan_on: bool,
+        current_temp: float | None,
+        target_temp: float | None,
+        polled: bool = True,
+    ) -> None:
+        """Advance the session state machine and fire the matching events.
+
+        Target-reached confirmations count consecutive polls, so pushed
+        notifications (polled=False) only drive session start and end.
+        """
+        if fan_on != self._session.last_fan_state:
+            self._session.last_fan_state = fan_on
+            _LOGGER.debug("Fan %s", "started" if fan_on else "stopped")
+            self._queue_session_event({
+                "type": "fan_started" if fan_on else "fan_stopped",
+                "timestamp": now.isoformat(),
+                "session_active": self._session.start_time is not None,
+            })
+
+        # Heat on = session started, heat off = session ended
+        if self._session.state is _SessionState.IDLE:
             if heat_on:
-                # Heat turned on = session started
-                if self._session_start_time is None:  # Prevent duplicate starts
-                    self._session_start_time = datetime.now()
-                    self._sessions_today += 1
-                    self._total_sessions += 1
-                    
-                    self.hass.bus.async_fire("volcano_session_event", {
-                        "type": "session_started",
-                        "timestamp": self._session_start_time.isoformat(),
-                        "session_count_today": self._sessions_today,
-                        "total_sessions": self._total_sessions,
-                    })
-                    _LOGGER.debug("Session started - Heat turned on")
-            else:
-                # Heat turned off = session ended
-                if self._session_start_time is not None:
-                    session_end_time = datetime.now()
-                    duration = (session_end_time - self._session_start_time).total_seconds() / 60
-                    
-                    self._session_durations.append(duration)
-                    if len(self._session_durations) > 100:
-                        self._session_durations.pop(0)
-                    
-                    self._last_session_end_time = session_end_time
-                    
-                    self.hass.bus.async_fire("volcano_session_event", {
-                        "type": "session_ended",
-                        "duration_minutes": round(duration, 1),
-                        "start_time": self._session_start_time.isoformat(),
-                        "end_time": session_end_time.isoformat(),
-                        "timestamp": session_end_time.isoformat(),
-                    })
-                    
-                    self._session_start_time = None
-                    _LOGGER.debug("Session ended - Heat turned off, Duration: %.1f minutes", duration)
-            
-            self._last_heat_state = heat_on
+                self._start_session(now)
+        elif not heat_on:
+            self._end_session(now)
+        elif self._session.state is _SessionState.HEATING and polled:
+            self._check_target_reached(now, current_temp, target_temp)
+
+    def _start_session(self, now: datetime) -> None:
+        """Start a session when heat turns on."""
+        self._session.state = _SessionState.HEATING
+        self._session.start_time = now
+        self._session.start_iso = now.isoformat()
+        self._session.start_monotonic = time.monotonic()
+        self._session.near_target_streak = 0
+        self._session.sessions_today += 1
+        self._session.total_sessions += 1
+
+        self._queue_session_event({
+            "type": "session_started",
+            "timestamp": self._session.start_iso,
+            "session_count_today": self._session.sessions_today,
+            "total_sessions": self._session.total_sessions,
+        })
+        _LOGGER.debug("Session started - Heat turned on")
+
+    def _end_session(self, now: datetime) -> None:
+        """End the session when heat turns off."""
+        # Monotonic clock keeps durations correct across wall-clock changes
+        duration = (time.monotonic() - self._session.start_monotonic) / 60
+
+        if len(self._session_durations) == self._session_durations.maxlen:
+            self._session_durations_sum -= self._session_durations[0]
+        self._session_durations.append(duration)
+        self._session_durations_sum += duration
+        self._last_session_duration = round(duration, 1)
+        self._average_session_duration = round(
+            self._session_durations_sum / len(self._session_durations), 1
+        )
+
+        self._session.last_end_time = now
+
+        end_iso = now.isoformat()
+        self._queue_session_event({
+            "type": "session_ended",
+            "duration_minutes": self._last_session_duration,
+            "start_time": self._session.start_iso,
+            "end_time": end_iso,
+            "timestamp": end_iso,
+        })
+
+        self._session.state = _SessionState.IDLE
+        self._session.start_time = None
+        _LOGGER.debug("Session ended - Heat turned off, Duration: %.1f minutes", duration)
+
+    def _check_target_reached(
+        self, now: datetime, current_temp: float | None, target_temp: float | None
+    ) -> None:
+        """Detect the target temperature being reached while heating.
+
+        The temperature has to stay within TEMP_REACHED_MARGIN of the target
+        for TEMP_REACHED_CONFIRMATIONS consecutive samples, so readings that
+        hover around the threshold don't fire repeated events.
+        """
+        if not current_temp or not target_temp or current_temp < target_temp - TEMP_REACHED_MARGIN:
+            self._session.near_target_streak = 0
+            return
+
+        if self._session.near_target_streak == 0:
+            self._session.near_target_since = time.monotonic()
+        self._session.near_target_streak += 1
+        if self._session.near_target_streak < TEMP_REACHED_CONFIRMATIONS:
+            return
+
+        ramp_seconds = self._session.near_target_since - self._session.start_monotonic
+        self._ramp_samples.append((target_temp, ramp_seconds))
+        self._ramp_windows.clear()
+        self._session.state = _SessionState.READY
+        _LOGGER.debug("Target %s°C reached after %.0f seconds", target_temp, ramp_seconds)
+
+        self._queue_session_event({
+            "type": "temperature_reached",
+            "target_temperature": target_temp,
+            "actual_temperature": current_temp,
+            "timestamp": now.isoformat(),
+            "session_active": True,
+            "heating_duration": round(ramp_seconds),
+        })
 
     @property
     def sessions_today(self) -> int:
         """Get sessions count for today."""
-        self._reset_daily_stats()
-        return self._sessions_today
+        self._reset_daily_stats(datetime.now())
+        return self._session.sessions_today
 
     @property
     def total_sessions(self) -> int:
         """Get total sessions count."""
-        return self._total_sessions
+        return self._session.total_sessions
 
     @property
     def average_session_duration(self) -> float | None:
         """Get average session duration in minutes."""
-        if not self._session_durations:
-            return None
-        return round(sum(self._session_durations) / len(self._session_durations), 1)
+        return self._average_session_duration
 
     @property
     def last_session_duration(self) -> float | None:
         """Get last session duration in minutes."""
-        return self._session_durations[-1] if self._session_durations else None
+        return self._last_session_duration
 
     @property
     def time_since_last_use(self) -> int | None:
         """Get minutes since last session ended."""
-        if self._last_session_end_time is None:
+        if self._session.last_end_time is None:
             return None
-        return int((datetime.now() - self._last_session_end_time).total_seconds() / 60)
+        return int((datetime.now() - self._session.last_end_time).total_seconds() / 60)
 
-    async def get_current_temperature(self) -> int | None:
-        """Get current actual temperature from device."""
-        try:
-            return await self.volcano_api.get_current_temperature()
-        except Exception as err:
-            _LOGGER.error("Error reading current temperature: %s", err)
-            return None
+    def _session_statistics(self, now: datetime) -> dict[str, Any]:
+        """Return session statistics evaluated at a single timestamp."""
+        self._reset_daily_stats(now)
+        time_since_last_use = None
+        if self._session.last_end_time is not None:
+            time_since_last_use = int((now - self._session.last_end_time).total_seconds() / 60)
+        return {
+            "sessions_today": self._session.sessions_today,
+            "total_sessions": self.total_sessions,
+            "last_session_duration": self.last_session_duration,
+            "average_session_duration": self.average_session_duration,
+            "time_since_last_use": time_since_last_use,
+        }
 
     async def get_device_info_data(self) -> dict[str, Any]:
-        """Get device information data."""
-        try:
-            info_data = {}
-            
-            # Get firmware versions
-            ble_fw = await self.volcano_api.get_ble_firmware_version()
-            if ble_fw:
-                info_data["ble_firmware_version"] = ble_fw
-                
-            volcano_fw = await self.volcano_api.get_volcano_firmware_version()
-            if volcano_fw:
-                info_data["volcano_firmware_version"] = volcano_fw
-                
-            # Get serial number
-            serial = await self.volcano_api.get_serial_number()
-            if serial:
-                info_data["serial_number"] = serial
-                
-            # Get operation hours and minutes
-            hours = await self.volcano_api.get_hours_of_operation()
-            if hours is not None:
-                info_data["hours_of_operation"] = hours
-                
-            minutes = await self.volcano_api.get_minutes_of_operation()
-            if minutes is not None:
-                info_data["minutes_of_operation"] = minutes
-                
-            return info_data
-        except Exception as err:
-            _LOGGER.error("Error reading device info: %s", err)
-            return {}
+        """Get device information data.
 
-    def _get_dynamic_update_interval(self) -> int:
+        Firmware versions and the serial number are only read until they
+        have been cached once; operation time is read on every call.
+        """
+        readers = {
+            "ble_firmware_version": self.volcano_api.get_ble_firmware_version,
+            "volcano_firmware_version": self.volcano_api.get_volcano_firmware_version,
+            "serial_number": self.volcano_api.get_serial_number,
+        }
+        keys = [key for key in readers if key not in self._cached_device_info]
+        operation_time, *results = await asyncio.gather(
+            self.volcano_api.get_operation_time(),
+            *(readers[key]() for key in keys),
+            return_exceptions=True,
+        )
+
+        info_data = {}
+        if isinstance(operation_time, Exception):
+            _LOGGER.error("Error reading device info (operation time): %s", operation_time)
+        else:
+            info_data["hours_of_operation"], info_data["minutes_of_operation"] = operation_time
+        for key, result in zip(keys, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Error reading device info (%s): %s", key, result)
+            elif result not in (None, ""):
+                info_data[key] = result
+        return info_data
+
+    @callback
+    def async_handle_advertisement(
+        self, service_info: BluetoothServiceInfoBleak, change: BluetoothChange
+    ) -> None:
+        """Reconnect on the first advertisement seen while disconnected."""
+        if self._listeners and not self.volcano_api.is_connected:
+            # The refresh debouncer coalesces bursts of advertisements
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def _cached_state(self) -> dict[str, Any]:
+        """Return device state as last pushed by notifications or read by the API."""
+        return {
+            "current_temperature": self.volcano_api.current_temperature,
+            "target_temperature": self.volcano_api.target_temperature,
+            "heat_on": self.volcano_api.heat_on,
+            "fan_on": self.volcano_api.fan_on,
+            "connected": self.volcano_api.is_connected,
+        }
+
+    @callback
+    def _handle_device_notification(self) -> None:
+        """Push notified device state to entities without waiting for a poll."""
+        now = datetime.now()
+        state = self._cached_state()
+        self._update_session_state(
+            now,
+            state["heat_on"],
+            state["fan_on"],
+            state["current_temperature"],
+            state["target_temperature"],
+            polled=False,
+        )
+        self._update_idle_state(
+            state["heat_on"], state["fan_on"], state["current_temperature"]
+        )
+
+        data = dict(self.data or {})
+        data.update(state)
+        data.update(self._session_statistics(now))
+        # Update listeners without async_set_updated_data, which would push
+        # the next poll back; steady notifications must not starve polling
+        self._apply_dynamic_update_interval(data)
+        self.data = data
+        self.async_update_listeners()
+
+    def _ramp_window_start(self, target_temp: float) -> float | None:
+        """Return the earliest plausible seconds-to-target for a heat-up ramp."""
+        if target_temp in self._ramp_windows:
+            return self._ramp_windows[target_temp]
+
+        durations = [
+            seconds
+            for target, seconds in self._ramp_samples
+            if abs(target - target_temp) <= RAMP_TARGET_TOLERANCE
+        ]
+        window_start = None
+        if len(durations) >= RAMP_MIN_SAMPLES:
+            try:
+                dist = NormalDist(fmean(durations), max(stdev(durations), 1.0))
+                window_start = max(dist.inv_cdf(RAMP_WINDOW_QUANTILE), 0.0)
+            except StatisticsError:
+                window_start = None
+        self._ramp_windows[target_temp] = window_start
+        return window_start
+
+    def _update_idle_state(
+        self, heat_on: bool, fan_on: bool, current_temp: float | None
+    ) -> None:
+        """Track how long the device has been idle and cold."""
+        if (
+            heat_on
+            or fan_on
+            or current_temp is None
+            or current_temp >= IDLE_COLD_TEMP
+            or (
+                self._idle_temp is not None
+                and abs(current_temp - self._idle_temp) > IDLE_WAKE_DELTA
+            )
+        ):
+            self._idle_since = None
+            self._idle_temp = None
+        elif self._idle_since is None:
+            self._idle_since = time.monotonic()
+            self._idle_temp = current_temp
+
+    @property
+    def _idle_minutes(self) -> float:
+        """Minutes the device has been idle and cold, 0 when active."""
+        if self._idle_since is None:
+            return 0.0
+        return (time.monotonic() - self._idle_since) / 60
+
+    def _apply_dynamic_update_interval(self, data: dict[str, Any]) -> None:
+        """Switch the poll interval to match the given data."""
+        new_interval = self._get_dynamic_update_interval(data)
+        if new_interval != self._current_interval_s:
+            self._current_interval_s = new_interval
+            self.update_interval = timedelta(seconds=new_interval)
+            _LOGGER.debug("Update interval changed to %s seconds", new_interval)
+
+    @callback
+    def async_set_updated_data(self, data: dict[str, Any]) -> None:
+        """Push data, picking the poll interval before the next poll is scheduled."""
+        self._apply_dynamic_update_interval(data)
+        super().async_set_updated_data(data)
+
+    def _get_dynamic_update_interval(self, data: dict[str, Any]) -> int:
         """Get update interval based on device state."""
-        heat_on = self.data.get("heat_on", False) if self.data else False
-        fan_on = self.data.get("fan_on", False) if self.data else False
-        current_temp = self.data.get("current_temperature", 0) if self.data else 0
-        target_temp = self.data.get("target_temperature", 0) if self.data else 0
+        heat_on = data.get("heat_on", False)
+        fan_on = data.get("fan_on", False)
+        current_temp = data.get("current_temperature") or 0
+        target_temp = data.get("target_temperature") or 0
         
         # Fast updates during fan operation (balloon sessions need real-time feedback)
         if fan_on:
             return self._fast_update_interval  # 1 second when fan is on
-        
-        # Active updates when heating and approaching target (last 10°C)
-        if heat_on and target_temp > 0 and current_temp > (target_temp - 10):
-            return self._fast_update_interval  # 1 second when close to target
-        
-        # Active updates when heating
-        if heat_on or (target_temp > 0 and current_temp < target_temp):
-            return self._active_update_interval  # 2 seconds when actively heating
-        
-        # Slower when cooling down but still warm
-        if current_temp > 50:
-            return 3  # 3 seconds when cooling
-        
-        # Normal updates when completely idle
-        return self._base_update_interval  # 5 seconds when cold/idle
+
+        # Back off exponentially once the device has been idle and cold a while
+        idle_minutes = self._idle_minutes
+        if idle_minutes >= IDLE_BACKOFF_AFTER_MINUTES:
+            return min(
+                IDLE_BACKOFF_MAX_INTERVAL,
+                self._base_update_interval * 2 ** int(idle_minutes / 2),
+            )
+
+        # Early in a heat-up ramp, poll no faster than needed to land on the
+        # start of the historically observed window for reaching this target
+        if heat_on and target_temp > 0 and self._session.state is _SessionState.HEATING:
+            window_start = self._ramp_window_start(target_temp)
+            if window_start is not None:
+                remaining = window_start - (time.monotonic() - self._session.start_monotonic)
+                if remaining > self._active_update_interval:
+                    return int(min(remaining, self._base_update_interval))
+
+        state = (
+            (_STATE_HEAT_ON if heat_on else 0)
+            | (_STATE_NEAR_TARGET if target_temp > 0 and current_temp > target_temp - 10 else 0)
+            | (_STATE_BELOW_TARGET if target_temp > 0 and current_temp < target_temp else 0)
+            | (_STATE_WARM if current_temp > 50 else 0)
+        )
+        return _UPDATE_INTERVALS[state]
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API endpoint."""
         try:
             data = {}
+            # Single timestamp shared by every event and statistic this cycle
+            now = datetime.now()
             
             # Try to reconnect if not connected
             if not self.volcano_api.is_connected:
@@ -297,96 +632,66 @@ class VolcanoCoordinator(DataUpdateCoordinator):
                 except VolcanoConnectionError as err:
                     _LOGGER.warning("Failed to reconnect to device: %s", err)
                     # Return minimal data indicating disconnection
-                    return {
-                        "connected": False,
-                        "current_temperature": None,
-                        "target_temperature": None,
-                        "heat_on": False,
-                        "fan_on": False,
-                    }
+                    return dict(DISCONNECTED_DATA)
             
-            # FAST UPDATE (every 5 seconds) - Temperature sensors
-            current_temp = await self.get_current_temperature()
+            if self.volcano_api.notifications_active and self.volcano_api.state_seeded:
+                # Temperatures and status are pushed by notifications, use cached state
+                status = self._cached_state()
+                current_temp = status["current_temperature"]
+                target_temp = status["target_temperature"]
+            else:
+                # Temperatures and status read in one batch; the idle backoff
+                # only stretches the interval, so heat switched on at the
+                # device is still seen on the next poll
+                status = await self.volcano_api.get_live_state()
+                current_temp = status["current_temperature"]
+                target_temp = status["target_temperature"]
+
+            # Get device status (connection status)
+            if status is not None:
+                data.update(status)
+            data["connected"] = self.volcano_api.is_connected
+
             if current_temp is not None:
                 data["current_temperature"] = current_temp
-            
-            target_temp = await self.volcano_api.get_target_temperature()
+
             if target_temp is not None:
                 data["target_temperature"] = target_temp
             
-            # Get device status (connection status)
-            status = await self.volcano_api.get_device_state()
-            if status is not None:
-                data.update(status)
-            
             # Session tracking and event firing
             fan_on = status.get("fan_on", False) if status else False
             
-            if current_temp is not None and target_temp is not None:
-                # Removed session start/stop detection based on temperature
-                pass
-            
+            heat_on = status.get("heat_on", False) if status else False
             if status:
-                self._handle_fan_events(fan_on)
-                self._handle_heat_events(status.get("heat_on", False))
-            
-            # Update tracking variables
-            self._last_temp = current_temp
-            self._last_target_temp = target_temp
-            self._last_fan_state = fan_on
+                self._update_session_state(now, heat_on, fan_on, current_temp, target_temp)
+            self._update_idle_state(heat_on, fan_on, current_temp)
             
             # Add session statistics to data
-            data.update({
-                "sessions_today": self.sessions_today,
-                "total_sessions": self.total_sessions,
-                "last_session_duration": self.last_session_duration,
-                "average_session_duration": self.average_session_duration,
-                "time_since_last_use": self.time_since_last_use,
-            })
-            
-            # Add session statistics to data
-            data["sessions_today"] = self.sessions_today
-            data["total_sessions"] = self.total_sessions
-            data["average_session_duration"] = self.average_session_duration
-            data["last_session_duration"] = self.last_session_duration
-            data["time_since_last_use"] = self.time_since_last_use
+            data.update(self._session_statistics(now))
         
             # SLOW UPDATE (every 10 minutes) - Device info sensors
-            # Initialize counter if not exists
-            if not hasattr(self, '_device_info_counter'):
-                self._device_info_counter = 0
-            
-            # Update device info every 120 cycles (120 * 5 seconds = 10 minutes)
-            if self._device_info_counter % 120 == 0:  
+            # Deferred while heating or the fan runs so it never competes with
+            # the fast reads for BLE bandwidth
+            if self._last_info_refresh is None or (
+                now - self._last_info_refresh >= DEVICE_INFO_REFRESH_INTERVAL
+                and not fan_on
+                and not heat_on
+            ):
                 device_info = await self.get_device_info_data()
-                if device_info:
-                    # Cache the device info for persistence
-                    self._cached_device_info = device_info
-                    data.update(device_info)
-            else:
-                # Use cached device info between slow updates
-                if hasattr(self, '_cached_device_info'):
-                    data.update(self._cached_device_info)
-                
-            self._device_info_counter += 1
+                self._last_info_refresh = now
+                # Merge so static values read earlier are kept
+                self._cached_device_info.update(device_info)
+            data.update(self._cached_device_info)
             
             # After getting all data, adjust update interval dynamically
-            new_interval = self._get_dynamic_update_interval()
-            if new_interval != self.update_interval.total_seconds():
-                self.update_interval = timedelta(seconds=new_interval)
-                _LOGGER.debug("Update interval changed to %s seconds", new_interval)
+            self._apply_dynamic_update_interval(data)
             
+            self.last_update_iso = now.isoformat()
             return data
         except VolcanoConnectionError as err:
             _LOGGER.warning("Connection error updating data: %s", err)
             # Return disconnected state instead of failing
-            return {
-                "connected": False,
-                "current_temperature": None,
-                "target_temperature": None,
-                "heat_on": False,
-                "fan_on": False,
-            }
+            return dict(DISCONNECTED_DATA)
         except Exception as err:
             _LOGGER.error("Unexpected error updating data: %s", err)
             raise UpdateFailed(f"Unexpected error: {err}") from err
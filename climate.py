@@ -5,6 +5,7 @@ import logging
 from typing import Any
 
 from homeassistant.components.climate import (
+    ATTR_HVAC_MODE,
     ClimateEntity,
     ClimateEntityFeature,
     HVACMode,
@@ -35,6 +36,8 @@ async def async_setup_entry(
 class VolcanoClimate(CoordinatorEntity, ClimateEntity):
     """Representation of a Volcano Hybrid climate device."""
 
+    _attr_has_entity_name = True
+    _attr_name = None  # Main feature, named after the device
     _attr_supported_features = (
         ClimateEntityFeature.TARGET_TEMPERATURE
         | ClimateEntityFeature.TURN_ON
@@ -49,24 +52,17 @@ class VolcanoClimate(CoordinatorEntity, ClimateEntity):
     def __init__(self, coordinator: VolcanoCoordinator) -> None:
         """Initialize the climate device."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_climate"
+        self._attr_unique_id = coordinator.uid_prefix + "climate"
         self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Hybrid"
+        self._update_from_data()
 
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        return self.coordinator.data.get("current_temperature")
-
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the target temperature."""
-        return self.coordinator.data.get("target_temperature")
-
-    @property
-    def hvac_mode(self) -> HVACMode:
-        """Return current hvac mode."""
-        return HVACMode.HEAT if self.coordinator.data.get("heat_on") else HVACMode.OFF
+    @callback
+    def _update_from_data(self) -> None:
+        """Copy coordinator data into state attributes once per update."""
+        data = self.coordinator.data or {}
+        self._attr_current_temperature = data.get("current_temperature")
+        self._attr_target_temperature = data.get("target_temperature")
+        self._attr_hvac_mode = HVACMode.HEAT if data.get("heat_on") else HVACMode.OFF
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
@@ -90,8 +86,15 @@ class VolcanoClimate(CoordinatorEntity, ClimateEntity):
         if temperature is None:
             return
 
+        hvac_mode = kwargs.get(ATTR_HVAC_MODE)
         try:
-            await self.coordinator.volcano_api.set_target_temperature(int(temperature))
+            if hvac_mode == HVACMode.HEAT:
+                # Target and heat on go out together as one BLE batch
+                await self.coordinator.volcano_api.set_preset(int(temperature))
+            else:
+                await self.coordinator.volcano_api.set_target_temperature(int(temperature))
+                if hvac_mode == HVACMode.OFF:
+                    await self.coordinator.volcano_api.set_heat_off()
             await self.coordinator.async_request_refresh()
 
         except (VolcanoConnectionError, ValueError) as err:
@@ -108,4 +111,5 @@ class VolcanoClimate(CoordinatorEntity, ClimateEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._update_from_data()
         super()._handle_coordinator_update()
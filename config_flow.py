@@ -3,15 +3,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
-from bleak import BleakScanner
 
 from homeassistant import config_entries
 from homeassistant.components.bluetooth import (
     BluetoothServiceInfoBleak,
     async_discovered_service_info,
+    async_last_service_info,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
@@ -22,6 +23,15 @@ from .volcano.api import VolcanoAPI
 
 _LOGGER = logging.getLogger(__name__)
 
+_VOLCANO_SERVICE_UUID_LOWER = VOLCANO_SERVICE_UUID.lower()
+
+# Lowercase substrings that identify a Volcano by its advertised name
+_NAME_HINTS = ("volcano", "storz")
+
+# A connectable advertisement this recent and strong counts as reachable
+ADVERTISEMENT_MAX_AGE = 30  # seconds
+ADVERTISEMENT_MIN_RSSI = -80  # dBm
+
 STEP_USER_DATA_SCHEMA = vol.Schema({
     vol.Required(CONF_MAC_ADDRESS): str,
 })
@@ -31,6 +41,12 @@ STEP_DISCOVERY_DATA_SCHEMA = vol.Schema({
 })
 
 
+def _normalize_mac(mac_address: str) -> str:
+    """Normalize a MAC address to upper-case, colon separated form."""
+    mac = mac_address.upper().replace(":", "").replace("-", "")
+    return ":".join(mac[i:i + 2] for i in range(0, 12, 2))
+
+
 class VolcanoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Volcano Hybrid."""
     
@@ -41,6 +57,7 @@ class VolcanoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._discovered_device: BluetoothServiceInfoBleak | None = None
         self._mac_address: str | None = None
         self._discovered_devices: list[dict[str, str]] = []
+        self._device_by_display: dict[str, dict[str, str]] = {}
 
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
@@ -53,18 +70,17 @@ class VolcanoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_abort(reason="not_supported")
 
         # Normalize MAC address format
-        formatted_mac = discovery_info.address.upper().replace(":", "").replace("-", "")
-        formatted_mac = ":".join([formatted_mac[i:i+2] for i in range(0, 12, 2)])
+        formatted_mac = _normalize_mac(discovery_info.address)
 
         await self.async_set_unique_id(formatted_mac)
         
         # Check if there's an active config entry (not just entities in registry)
-        existing_entries = [
-            entry for entry in self._async_current_entries()
-            if entry.data.get(CONF_MAC_ADDRESS) == formatted_mac
-        ]
+        existing_entry = any(
+            entry.data.get(CONF_MAC_ADDRESS) == formatted_mac
+            for entry in self._async_current_entries()
+        )
         
-        if existing_entries:
+        if existing_entry:
             _LOGGER.debug("Device %s already has active config entry, ignoring discovery", formatted_mac)
             return self.async_abort(reason="already_configured")
         
@@ -107,28 +123,22 @@ class VolcanoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             if "device" in user_input:
                 # User selected a device from the scan results
-                selected_display = user_input["device"]
-                selected_device = None
-                for device in self._discovered_devices:
-                    if device["display"] == selected_display:
-                        selected_device = device
-                        break
+                selected_device = self._device_by_display.get(user_input["device"])
                 
                 if selected_device:
                     mac_address = selected_device["address"]
-                    formatted_mac = mac_address.upper().replace(":", "").replace("-", "")
-                    formatted_mac = ":".join([formatted_mac[i:i+2] for i in range(0, 12, 2)])
+                    formatted_mac = _normalize_mac(mac_address)
                     
                     try:
                         await self.async_set_unique_id(formatted_mac)
                         
                         # Check for existing active config entries, not just entity registry
-                        existing_entries = [
-                            entry for entry in self._async_current_entries()
-                            if entry.data.get(CONF_MAC_ADDRESS) == formatted_mac
-                        ]
+                        existing_entry = any(
+                            entry.data.get(CONF_MAC_ADDRESS) == formatted_mac
+                            for entry in self._async_current_entries()
+                        )
                         
-                        if existing_entries:
+                        if existing_entry:
                             errors["base"] = "already_configured"
                         elif await self._test_connection(formatted_mac):
                             return self.async_create_entry(
@@ -168,20 +178,18 @@ class VolcanoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         
         if user_input is not None:
-            mac_address = user_input[CONF_MAC_ADDRESS].upper().replace(":", "").replace("-", "")
-            # Reformat MAC address
-            formatted_mac = ":".join([mac_address[i:i+2] for i in range(0, 12, 2)])
+            formatted_mac = _normalize_mac(user_input[CONF_MAC_ADDRESS])
             
             try:
                 await self.async_set_unique_id(formatted_mac)
                 
                 # Check for existing active config entries, not just entity registry
-                existing_entries = [
-                    entry for entry in self._async_current_entries()
-                    if entry.data.get(CONF_MAC_ADDRESS) == formatted_mac
-                ]
+                existing_entry = any(
+                    entry.data.get(CONF_MAC_ADDRESS) == formatted_mac
+                    for entry in self._async_current_entries()
+                )
                 
-                if existing_entries:
+                if existing_entry:
                     errors["base"] = "already_configured"
                 elif await self._test_connection(formatted_mac):
                     return self.async_create_entry(
@@ -204,60 +212,65 @@ class VolcanoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors
         )
 
-    def _is_volcano_device(self, discovery_info: BluetoothServiceInfoBleak) -> bool:
+    @staticmethod
+    def _is_volcano_device(discovery_info: BluetoothServiceInfoBleak) -> bool:
         """Check if the discovered device is a Volcano."""
-        name = discovery_info.name or ""
-        return (
-            "volcano" in name.lower() or
-            "storz" in name.lower() or
-            VOLCANO_SERVICE_UUID.lower() in [uuid.lower() for uuid in discovery_info.service_uuids]
+        name = (discovery_info.name or "").lower()
+        if any(hint in name for hint in _NAME_HINTS):
+            return True
+        return any(
+            uuid.lower() == _VOLCANO_SERVICE_UUID_LOWER
+            for uuid in discovery_info.service_uuids
         )
 
     async def _test_connection(self, mac_address: str) -> bool:
         """Test connection to the device."""
+        info = async_last_service_info(self.hass, mac_address, connectable=True)
+        if (
+            info is not None
+            and info.rssi > ADVERTISEMENT_MIN_RSSI
+            and time.monotonic() - info.time < ADVERTISEMENT_MAX_AGE
+        ):
+            _LOGGER.debug("%s is advertising (RSSI %s), skipping connection test", mac_address, info.rssi)
+            return True
+
+        api = VolcanoAPI(self.hass, mac_address)
         try:
-            api = VolcanoAPI(self.hass, mac_address)
             # Add timeout for connection test
-            connected = await asyncio.wait_for(api.connect(), timeout=15.0)
-            if connected:
-                await api.disconnect()
-                return True
+            return await asyncio.wait_for(api.connect(), timeout=15.0)
         except asyncio.TimeoutError:
             _LOGGER.debug("Connection test timed out for %s", mac_address)
         except Exception as err:
             _LOGGER.debug("Connection test failed: %s", err)
+        finally:
+            # Also runs when the timeout cancels the attempt part way through connecting
+            await api.disconnect()
         return False
 
     async def _scan_for_volcano_devices(self) -> list[dict[str, str]]:
-        """Scan for Volcano devices using BleakScanner."""
-        try:
-            _LOGGER.debug("Scanning for Volcano devices...")
-            devices = await BleakScanner.discover(timeout=10.0)
-            discovered_devices = []
-            
-            for device in devices:
-                # Check if device.name is not None before looking for "VOLCANO" in it
-                if device.name and "VOLCANO" in device.name.upper():
-                    discovered_devices.append({
-                        "name": device.name,
-                        "address": device.address,
-                        "display": f"{device.name} - ({device.address})"
-                    })
-                    _LOGGER.debug("Found VOLCANO device: %s, MAC Address: %s", device.name, device.address)
-            
-            return discovered_devices
-        except Exception as err:
-            _LOGGER.error("Error during BLE scan: %s", err)
-            return []
+        """Find Volcano devices in Home Assistant's Bluetooth advertisement cache."""
+        discovered_devices = []
+        for info in async_discovered_service_info(self.hass, connectable=True):
+            if self._is_volcano_device(info):
+                name = info.name or "Volcano"
+                discovered_devices.append({
+                    "name": name,
+                    "address": info.address,
+                    "display": f"{name} - ({info.address})"
+                })
+                _LOGGER.debug("Found VOLCANO device: %s, MAC Address: %s", name, info.address)
+        return discovered_devices
 
     def _get_discovery_schema(self) -> vol.Schema:
         """Get the discovery schema with found devices."""
         if not self._discovered_devices:
             return vol.Schema({})
         
-        device_options = {device["display"]: device["display"] for device in self._discovered_devices}
+        self._device_by_display = {
+            device["display"]: device for device in self._discovered_devices
+        }
         return vol.Schema({
-            vol.Required("device"): vol.In(device_options),
+            vol.Required("device"): vol.In(list(self._device_by_display)),
         })
 
     @staticmethod
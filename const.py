@@ -15,18 +15,23 @@ MANUFACTURER: Final = "Storz & Bickel"
 
 # BLE Service UUID for discovery
 VOLCANO_SERVICE_UUID: Final = "10100000-5354-4f52-5a26-4249434b454c"
+# Service holding the 1011xxxx control and temperature characteristics
+VOLCANO_CONTROL_SERVICE_UUID: Final = "10110000-5354-4f52-5a26-4249434b454c"
+
+# Events
+EVENT_SESSION: Final = "volcano_session_event"
 
 # Update intervals
 DEFAULT_SCAN_INTERVAL: Final = 30
 FAST_SCAN_INTERVAL: Final = 5
 
 # Platforms
-PLATFORMS: list[Platform] = [
+PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.CLIMATE,
     Platform.FAN,
     Platform.SENSOR,
     Platform.NUMBER,
-]
+)
 
 # Temperature constants
 MIN_TEMP: Final = 40
@@ -38,11 +43,7 @@ MIN_FAN_TIMER: Final = 1
 MAX_FAN_TIMER: Final = 300
 DEFAULT_FAN_TIMER: Final = 30
 
-# Note: Temperature presets have been moved to blueprint configuration
-# Users can now define custom temperature presets in automation blueprints
-
-# Note: Custom services have been moved to automation blueprints
-# SERVICE_START_SESSION and SERVICE_TEMPERATURE_SEQUENCE are now handled via blueprints
+# Control and state characteristics
 CHAR_HEAT_ON: Final = "1011000f-5354-4f52-5a26-4249434b454c"
 CHAR_HEAT_OFF: Final = "10110010-5354-4f52-5a26-4249434b454c"
 CHAR_FAN_ON: Final = "10110013-5354-4f52-5a26-4249434b454c"
@@ -57,7 +58,7 @@ CHAR_BLE_FIRMWARE_VERSION: Final = "10100004-5354-4f52-5a26-4249434b454c"
 CHAR_SERIAL_NUMBER: Final = "10100008-5354-4f52-5a26-4249434b454c"
 CHAR_VOLCANO_FIRMWARE_VERSION: Final = "10100003-5354-4f52-5a26-4249434b454c"
 CHAR_BLE_DEVICE: Final = "00000000-0000-0000-0000-000000000420"
-CHAR_HOURS_OF_OPERATION: Final = "10110015-5354-4f52-5a26-4249434b454c"  
+CHAR_HOURS_OF_OPERATION: Final = "10110015-5354-4f52-5a26-4249434b454c"
 CHAR_MINUTES_OF_OPERATION: Final = "10110016-5354-4f52-5a26-4249434b454c"
 
 # Screen brightness limits
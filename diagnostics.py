@@ -20,7 +20,7 @@ async def async_get_config_entry_diagnostics(
         "device_info": {
             "mac_address": coordinator._mac_address,
             "connection_state": coordinator.volcano_api.is_connected,
-            "last_update": coordinator.last_update_success_time.isoformat() if coordinator.last_update_success_time else None,
+            "last_update": coordinator.last_update_iso,
             "update_interval": coordinator.update_interval.total_seconds(),
         },
         "current_state": coordinator.data,
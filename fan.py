@@ -1,14 +1,15 @@
 """Fan platform for Volcano Hybrid."""
 from __future__ import annotations
 
-import asyncio
 import logging
+from datetime import datetime
 from typing import Any
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
@@ -31,16 +32,17 @@ async def async_setup_entry(
 class VolcanoFan(CoordinatorEntity, FanEntity):
     """Representation of a Volcano Hybrid fan."""
 
+    _attr_has_entity_name = True
+    _attr_name = "Fan"
     _attr_supported_features = FanEntityFeature.TURN_ON | FanEntityFeature.TURN_OFF
     _attr_speed_count = 1  # On/Off only
 
     def __init__(self, coordinator: VolcanoCoordinator) -> None:
         """Initialize the fan."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_fan"
+        self._attr_unique_id = coordinator.uid_prefix + "fan"
         self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Hybrid Fan"
-        self._timer_task: asyncio.Task | None = None
+        self._cancel_timer: CALLBACK_TYPE | None = None
 
     @property
     def is_on(self) -> bool:
@@ -60,48 +62,72 @@ class VolcanoFan(CoordinatorEntity, FanEntity):
             # Handle timer if specified
             duration = kwargs.get("duration")
             if duration:
-                await self._schedule_fan_off_timer(duration)
+                self._schedule_fan_off_timer(duration)
             
-            await self.coordinator.async_request_refresh()
+            self._async_set_fan_state(True)
 
         except VolcanoConnectionError as err:
             _LOGGER.error("Failed to turn on fan: %s", err)
+            await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the fan off."""
         try:
             # Cancel any existing timer
-            if self._timer_task and not self._timer_task.done():
-                self._timer_task.cancel()
-                self._timer_task = None
+            self._cancel_fan_off_timer()
 
             await self.coordinator.volcano_api.set_fan_off()
-            await self.coordinator.async_request_refresh()
+            self._async_set_fan_state(False)
 
         except VolcanoConnectionError as err:
             _LOGGER.error("Failed to turn off fan: %s", err)
+            await self.coordinator.async_request_refresh()
+
+    @callback
+    def _async_set_fan_state(self, fan_on: bool) -> None:
+        """Push the commanded fan state without waiting for a BLE re-read."""
+        self.coordinator.async_set_updated_data(
+            {**self.coordinator.data, "fan_on": fan_on}
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Register with the coordinator so the fan timer can reach us."""
+        await super().async_added_to_hass()
+        self.coordinator.fan_entity = self
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending fan timer when the entity goes away."""
+        self._cancel_fan_off_timer()
+        if self.coordinator.fan_entity is self:
+            self.coordinator.fan_entity = None
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _cancel_fan_off_timer(self) -> None:
+        """Cancel the pending fan off timer, if any."""
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
 
-    async def _schedule_fan_off_timer(self, duration: int) -> None:
+    @callback
+    def _schedule_fan_off_timer(self, duration: int) -> None:
         """Schedule fan to turn off after duration seconds."""
         # Cancel existing timer
-        if self._timer_task and not self._timer_task.done():
-            self._timer_task.cancel()
-
-        async def turn_off_after_delay():
-            """Turn off fan after delay."""
-            try:
-                await asyncio.sleep(duration)
-                await self.coordinator.volcano_api.set_fan_off()
-                await self.coordinator.async_request_refresh()
-                _LOGGER.info("Fan turned off after %d second timer", duration)
-            except asyncio.CancelledError:
-                _LOGGER.debug("Fan timer cancelled")
-            except Exception as err:
-                _LOGGER.error("Error in fan timer: %s", err)
-
-        self._timer_task = asyncio.create_task(turn_off_after_delay())
+        self._cancel_fan_off_timer()
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        super()._handle_coordinator_update()
+        @callback
+        def _fire_fan_off(_now: datetime) -> None:
+            """Hand the fan off command to the event loop."""
+            self._cancel_timer = None
+            self.hass.async_create_task(self._async_timer_fan_off(duration))
+
+        self._cancel_timer = async_call_later(self.hass, duration, _fire_fan_off)
+
+    async def _async_timer_fan_off(self, duration: int) -> None:
+        """Turn off fan once the timer expires."""
+        try:
+            await self.coordinator.volcano_api.set_fan_off()
+            self._async_set_fan_state(False)
+            _LOGGER.info("Fan turned off after %d second timer", duration)
+        except Exception as err:
+            _LOGGER.error("Error in fan timer: %s", err)
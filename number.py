@@ -7,6 +7,7 @@ from typing import Any
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -15,6 +16,9 @@ from . import VolcanoCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds brightness changes are held so only the last one is written
+BRIGHTNESS_WRITE_COOLDOWN = 0.05
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -24,10 +28,10 @@ async def async_setup_entry(
     """Set up the number platform."""
     coordinator: VolcanoCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     
-    entities = [
+    entities = (
         VolcanoFanTimer(coordinator),
         VolcanoScreenBrightness(coordinator),
-    ]
+    )
     
     async_add_entities(entities)
 
@@ -35,6 +39,8 @@ async def async_setup_entry(
 class VolcanoFanTimer(CoordinatorEntity, NumberEntity):
     """Number entity for fan timer duration."""
 
+    _attr_has_entity_name = True
+    _attr_name = "Fan Timer"
     _attr_mode = NumberMode.BOX
     _attr_native_min_value = 5
     _attr_native_max_value = 300
@@ -45,9 +51,8 @@ class VolcanoFanTimer(CoordinatorEntity, NumberEntity):
     def __init__(self, coordinator: VolcanoCoordinator) -> None:
         """Initialize the number entity."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_fan_timer"
+        self._attr_unique_id = coordinator.uid_prefix + "fan_timer"
         self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Fan Timer"
         self._timer_value = 36  # Default timer value
 
     @property
@@ -62,22 +67,16 @@ class VolcanoFanTimer(CoordinatorEntity, NumberEntity):
 
     async def async_start_timer(self) -> None:
         """Start the fan with timer."""
-        from .fan import VolcanoFan
-        
-        # Find the fan entity and start timer
-        fan_entities = [
-            entity for entity in self.hass.data[DOMAIN].values()
-            if isinstance(entity, VolcanoFan)
-        ]
-        
-        if fan_entities:
-            fan_entity = fan_entities[0]
+        fan_entity = self.coordinator.fan_entity
+        if fan_entity is not None:
             await fan_entity.async_turn_on(duration=self._timer_value)
 
 
 class VolcanoScreenBrightness(CoordinatorEntity, NumberEntity):
     """Number entity for screen brightness."""
 
+    _attr_has_entity_name = True
+    _attr_name = "Screen Brightness"
     _attr_mode = NumberMode.SLIDER
     _attr_native_min_value = 0
     _attr_native_max_value = 100
@@ -88,10 +87,18 @@ class VolcanoScreenBrightness(CoordinatorEntity, NumberEntity):
     def __init__(self, coordinator: VolcanoCoordinator) -> None:
         """Initialize the number entity."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_screen_brightness"
+        self._attr_unique_id = coordinator.uid_prefix + "screen_brightness"
         self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Screen Brightness"
         self._brightness_value = 70  # Default brightness
+        # Last value actually written; the default above is never sent
+        self._written_brightness: int | None = None
+        self._write_debouncer = Debouncer(
+            coordinator.hass,
+            _LOGGER,
+            cooldown=BRIGHTNESS_WRITE_COOLDOWN,
+            immediate=False,
+            function=self._async_write_brightness,
+        )
 
     @property
     def native_value(self) -> float:
@@ -100,11 +107,32 @@ class VolcanoScreenBrightness(CoordinatorEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the brightness value."""
+        self._brightness_value = int(value)
+        self.async_write_ha_state()
+        await self._write_debouncer.async_call()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop any pending brightness write."""
+        self._write_debouncer.async_cancel()
+        await super().async_will_remove_from_hass()
+
+    async def _async_write_brightness(self) -> None:
+        """Write the latest requested brightness if it differs from the device."""
+        brightness = self._brightness_value
+        if brightness == self._written_brightness:
+            return
+
         try:
-            brightness = int(value)
             await self.coordinator.volcano_api.set_screen_brightness(brightness)
-            self._brightness_value = brightness
+            self._written_brightness = brightness
             _LOGGER.debug("Screen brightness set to %d%%", brightness)
 
         except Exception as err:
             _LOGGER.error("Failed to set screen brightness: %s", err)
+            # Show the device's brightness again unless a newer value is pending
+            if (
+                self._written_brightness is not None
+                and self._brightness_value == brightness
+            ):
+                self._brightness_value = self._written_brightness
+                self.async_write_ha_state()
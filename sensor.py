@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+from abc import abstractmethod
 from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -21,6 +22,71 @@ from . import VolcanoCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sensors that just mirror one key of the coordinator data
+DICT_SENSORS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="target_temperature",
+        name="Target Temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:thermometer",
+    ),
+    SensorEntityDescription(
+        key="current_temperature",
+        name="Current Temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:thermometer",
+    ),
+    SensorEntityDescription(
+        key="ble_firmware_version",
+        name="BLE Firmware Version",
+        icon="mdi:chip",
+    ),
+    SensorEntityDescription(
+        key="volcano_firmware_version",
+        name="Firmware Version",
+        icon="mdi:chip",
+    ),
+    SensorEntityDescription(
+        key="serial_number",
+        name="Serial Number",
+        icon="mdi:barcode",
+    ),
+    SensorEntityDescription(
+        key="sessions_today",
+        name="Sessions Today",
+        native_unit_of_measurement="sessions",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:counter",
+    ),
+    SensorEntityDescription(
+        key="total_sessions",
+        name="Total Sessions",
+        native_unit_of_measurement="sessions",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:counter",
+    ),
+    SensorEntityDescription(
+        key="last_session_duration",
+        name="Last Session Duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:timer",
+    ),
+    SensorEntityDescription(
+        key="average_session_duration",
+        name="Average Session Duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:timer-outline",
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -30,198 +96,117 @@ async def async_setup_entry(
     """Set up the sensor platform."""
     coordinator: VolcanoCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     
-    entities = [
-        # Temperature sensors
-        VolcanoTargetTemperature(coordinator),
-        VolcanoCurrentTemperature(coordinator),
-        
-        # Connection and device info
+    entities = (
+        *(VolcanoDictSensor(coordinator, description) for description in DICT_SENSORS),
         VolcanoConnectionStatus(coordinator),
-        VolcanoHeatStatusSensor(coordinator),  # NEW
-        VolcanoFanStatusSensor(coordinator),   # NEW
-        VolcanoBLEFirmwareVersion(coordinator),
-        VolcanoFirmwareVersion(coordinator),
-        VolcanoSerialNumber(coordinator),
+        VolcanoHeatStatusSensor(coordinator),
+        VolcanoFanStatusSensor(coordinator),
         VolcanoTotalOperationTime(coordinator),
-        
-        # Session tracking statistics
-        VolcanoSessionsTodaySensor(coordinator),
-        VolcanoTotalSessionsSensor(coordinator),
-        VolcanoLastSessionDurationSensor(coordinator),
-        VolcanoAverageSessionDurationSensor(coordinator),
         VolcanoTimeSinceLastUseSensor(coordinator),
-    ]
+    )
     
     async_add_entities(entities)
 
 
-class VolcanoTargetTemperature(CoordinatorEntity, SensorEntity):
-    """Sensor for current target temperature."""
+class VolcanoSensorBase(CoordinatorEntity, SensorEntity):
+    """Base sensor that caches its state once per coordinator update."""
 
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:thermometer"
+    _attr_has_entity_name = True
 
-    def __init__(self, coordinator: VolcanoCoordinator) -> None:
+    def __init__(self, coordinator: VolcanoCoordinator, uid_suffix: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_target_temperature"
+        self._attr_unique_id = coordinator.uid_prefix + uid_suffix
         self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Target Temperature"
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("target_temperature")
+    async def async_added_to_hass(self) -> None:
+        """Populate cached state before the first write."""
+        await super().async_added_to_hass()
+        self._update_from_data(self.coordinator.data or {})
 
+    @abstractmethod
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Copy coordinator data into state attributes."""
 
-class VolcanoCurrentTemperature(CoordinatorEntity, SensorEntity):
-    """Sensor for current actual temperature."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached state, then write it."""
+        self._update_from_data(self.coordinator.data or {})
+        super()._handle_coordinator_update()
 
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:thermometer"
 
-    def __init__(self, coordinator: VolcanoCoordinator) -> None:
+class VolcanoDictSensor(VolcanoSensorBase):
+    """Sensor that reports a single key from the coordinator data."""
+
+    def __init__(
+        self, coordinator: VolcanoCoordinator, description: SensorEntityDescription
+    ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_current_temperature"
-        self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Current Temperature"
+        super().__init__(coordinator, description.key)
+        self.entity_description = description
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("current_temperature")
+    @callback
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Copy the sensor's key into its state."""
+        self._attr_native_value = data.get(self.entity_description.key)
 
 
-class VolcanoConnectionStatus(CoordinatorEntity, SensorEntity):
+class VolcanoConnectionStatus(VolcanoSensorBase):
     """Sensor for connection status."""
 
+    _attr_name = "Connection Status"
     _attr_icon = "mdi:bluetooth"
 
     def __init__(self, coordinator: VolcanoCoordinator) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_connection_status"
-        self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Connection Status"
-
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        return "Connected" if self.coordinator.volcano_api.is_connected else "Disconnected"
-
-    @property
-    def icon(self) -> str:
-        """Return the icon for the sensor."""
-        return "mdi:bluetooth-connect" if self.coordinator.volcano_api.is_connected else "mdi:bluetooth-off"
-
-
-class VolcanoBLEFirmwareVersion(CoordinatorEntity, SensorEntity):
-    """Sensor for BLE firmware version."""
-
-    _attr_icon = "mdi:chip"
-
-    def __init__(self, coordinator: VolcanoCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_ble_firmware_version"
-        self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano BLE Firmware Version"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("ble_firmware_version")
-
-
-class VolcanoFirmwareVersion(CoordinatorEntity, SensorEntity):
-    """Sensor for Volcano firmware version."""
-
-    _attr_icon = "mdi:chip"
-
-    def __init__(self, coordinator: VolcanoCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_volcano_firmware_version"
-        self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Firmware Version"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("volcano_firmware_version")
-
-
-class VolcanoSerialNumber(CoordinatorEntity, SensorEntity):
-    """Sensor for device serial number."""
-
-    _attr_icon = "mdi:barcode"
-
-    def __init__(self, coordinator: VolcanoCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_serial_number"
-        self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Serial Number"
+        super().__init__(coordinator, "connection_status")
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("serial_number")
+    @callback
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Update state and icon from the connection flag."""
+        connected = data.get("connected", False)
+        self._attr_native_value = "Connected" if connected else "Disconnected"
+        self._attr_icon = "mdi:bluetooth-connect" if connected else "mdi:bluetooth-off"
 
 
-class VolcanoTotalOperationTime(CoordinatorEntity, SensorEntity):
+class VolcanoTotalOperationTime(VolcanoSensorBase):
     """Sensor for total operation time in days:hours:minutes format."""
 
+    _attr_name = "Total Operation Time"
     _attr_icon = "mdi:clock-time-eight"
     _attr_native_unit_of_measurement = None  # Custom format
 
     def __init__(self, coordinator: VolcanoCoordinator) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_total_operation_time"
-        self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Total Operation Time"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor in days:hours:minutes format."""
-        hours = self.coordinator.data.get("hours_of_operation", 0)
-        minutes = self.coordinator.data.get("minutes_of_operation", 0)
+        super().__init__(coordinator, "total_operation_time")
+        self._last_inputs: tuple[Any, Any] | None = None
+
+    @callback
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Format the operation time as days:hours:minutes."""
+        hours = data.get("hours_of_operation", 0)
+        minutes = data.get("minutes_of_operation", 0)
+        
+        # The counters change every few minutes at most, skip reformatting
+        if (hours, minutes) == self._last_inputs:
+            return
+        self._last_inputs = (hours, minutes)
         
         if hours is None and minutes is None:
-            return None
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
+            return
         
         # Convert to total minutes
         total_minutes = (hours or 0) * 60 + (minutes or 0)
         
         # Calculate days, hours, and remaining minutes
-        days = total_minutes // (24 * 60)
-        remaining_minutes = total_minutes % (24 * 60)
-        hours_part = remaining_minutes // 60
-        minutes_part = remaining_minutes % 60
+        days, remaining_minutes = divmod(total_minutes, 24 * 60)
+        hours_part, minutes_part = divmod(remaining_minutes, 60)
         
-        return f"{days}d {hours_part}h {minutes_part}m"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        hours = self.coordinator.data.get("hours_of_operation", 0)
-        minutes = self.coordinator.data.get("minutes_of_operation", 0)
-        
-        if hours is None and minutes is None:
-            return {}
-        
-        total_minutes = (hours or 0) * 60 + (minutes or 0)
-        total_hours = total_minutes / 60
-        days = total_minutes // (24 * 60)
-        
-        return {
-            "total_hours": round(total_hours, 1),
+        self._attr_native_value = f"{days}d {hours_part}h {minutes_part}m"
+        self._attr_extra_state_attributes = {
+            "total_hours": round(total_minutes / 60, 1),
             "total_minutes": total_minutes,
             "days": days,
             "raw_hours": hours or 0,
@@ -229,91 +214,10 @@ class VolcanoTotalOperationTime(CoordinatorEntity, SensorEntity):
         }
 
 
-class VolcanoSessionsTodaySensor(CoordinatorEntity, SensorEntity):
-    """Sensor for sessions count today."""
-
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-    _attr_icon = "mdi:counter"
-    _attr_native_unit_of_measurement = "sessions"
-
-    def __init__(self, coordinator: VolcanoCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_sessions_today"
-        self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Sessions Today"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("sessions_today")
-
-
-class VolcanoTotalSessionsSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for total sessions count."""
-
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-    _attr_icon = "mdi:counter"
-    _attr_native_unit_of_measurement = "sessions"
-
-    def __init__(self, coordinator: VolcanoCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_total_sessions"
-        self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Total Sessions"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("total_sessions")
-
-
-class VolcanoLastSessionDurationSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for last session duration."""
-
-    _attr_device_class = SensorDeviceClass.DURATION
-    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:timer"
-
-    def __init__(self, coordinator: VolcanoCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_last_session_duration"
-        self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Last Session Duration"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("last_session_duration")
-
-
-class VolcanoAverageSessionDurationSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for average session duration."""
-
-    _attr_device_class = SensorDeviceClass.DURATION
-    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:timer-outline"
-
-    def __init__(self, coordinator: VolcanoCoordinator) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_average_session_duration"
-        self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Average Session Duration"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("average_session_duration")
-
-
-class VolcanoTimeSinceLastUseSensor(CoordinatorEntity, SensorEntity):
+class VolcanoTimeSinceLastUseSensor(VolcanoSensorBase):
     """Sensor for time since last use."""
 
+    _attr_name = "Time Since Last Use"
     _attr_device_class = SensorDeviceClass.DURATION
     _attr_native_unit_of_measurement = UnitOfTime.MINUTES
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -321,80 +225,66 @@ class VolcanoTimeSinceLastUseSensor(CoordinatorEntity, SensorEntity):
 
     def __init__(self, coordinator: VolcanoCoordinator) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_time_since_last_use"
-        self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Time Since Last Use"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("time_since_last_use")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return additional state attributes."""
-        time_since = self.coordinator.data.get("time_since_last_use")
+        super().__init__(coordinator, "time_since_last_use")
+
+    @callback
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Update the minutes since last use and readable attributes."""
+        time_since = data.get("time_since_last_use")
+        # Only changes once a minute while polls run every few seconds
+        if time_since == self._attr_native_value:
+            return
+        self._attr_native_value = time_since
         if time_since is None:
-            return None
+            self._attr_extra_state_attributes = None
+            return
         
         # Convert minutes to human readable format
-        hours = time_since // 60
-        minutes = time_since % 60
+        hours, minutes = divmod(time_since, 60)
         
         if hours > 0:
             readable = f"{hours}h {minutes}m"
         else:
             readable = f"{minutes}m"
             
-        return {
+        self._attr_extra_state_attributes = {
             "readable_time": readable,
             "hours": hours,
             "minutes_remainder": minutes,
         }
 
 
-class VolcanoHeatStatusSensor(CoordinatorEntity, SensorEntity):
+class VolcanoHeatStatusSensor(VolcanoSensorBase):
     """Sensor for heat status."""
 
+    _attr_name = "Heat Status"
     _attr_icon = "mdi:heating-coil"
 
     def __init__(self, coordinator: VolcanoCoordinator) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_heat_status"
-        self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Heat Status"
-
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        return "On" if self.coordinator.data.get("heat_on", False) else "Off"
+        super().__init__(coordinator, "heat_status")
 
-    @property
-    def icon(self) -> str:
-        """Return the icon for the sensor."""
-        return "mdi:fire" if self.coordinator.data.get("heat_on", False) else "mdi:fire-off"
+    @callback
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Update state and icon from the heat flag."""
+        heat_on = data.get("heat_on", False)
+        self._attr_native_value = "On" if heat_on else "Off"
+        self._attr_icon = "mdi:fire" if heat_on else "mdi:fire-off"
 
 
-class VolcanoFanStatusSensor(CoordinatorEntity, SensorEntity):
+class VolcanoFanStatusSensor(VolcanoSensorBase):
     """Sensor for fan status."""
 
+    _attr_name = "Fan Status"
     _attr_icon = "mdi:fan"
 
     def __init__(self, coordinator: VolcanoCoordinator) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator._mac_address}_fan_status"
-        self._attr_device_info = coordinator.device_info
-        self._attr_name = "Volcano Fan Status"
-
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        return "On" if self.coordinator.data.get("fan_on", False) else "Off"
-
-    @property
-    def icon(self) -> str:
-        """Return the icon for the sensor."""
-        return "mdi:fan" if self.coordinator.data.get("fan_on", False) else "mdi:fan-off"
+        super().__init__(coordinator, "fan_status")
+
+    @callback
+    def _update_from_data(self, data: dict[str, Any]) -> None:
+        """Update state and icon from the fan flag."""
+        fan_on = data.get("fan_on", False)
+        self._attr_native_value = "On" if fan_on else "Off"
+        self._attr_icon = "mdi:fan" if fan_on else "mdi:fan-off"
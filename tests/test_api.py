@@ -0,0 +1,30 @@
+"""Tests for the Volcano Hybrid BLE API."""
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.volcano_hybrid.volcano.api import VolcanoAPI
+
+
+@pytest.mark.parametrize(
+    ("raw", "heat_on", "fan_on"),
+    [
+        (0x0000, False, False),
+        (0x0020, True, False),
+        (0x2000, False, True),
+        (0x2020, True, True),
+        # Bits outside the heat and fan masks are ignored
+        (0xDFDF, False, False),
+    ],
+)
+async def test_apply_status_word(
+    hass: HomeAssistant, raw: int, heat_on: bool, fan_on: bool
+) -> None:
+    """Test decoding heat and fan state from the status register."""
+    api = VolcanoAPI(hass, "00:11:22:33:44:55")
+
+    assert api._apply_status_word(raw, "test") is (heat_on or fan_on)
+    assert api.heat_on is heat_on
+    assert api.fan_on is fan_on
+
+    # Applying the same word again reports no change
+    assert api._apply_status_word(raw, "test") is False
@@ -0,0 +1,18 @@
+"""Tests for the Volcano Hybrid config flow."""
+import pytest
+
+from custom_components.volcano_hybrid.config_flow import _normalize_mac
+
+
+@pytest.mark.parametrize(
+    "mac_address",
+    [
+        "00:11:22:aa:bb:cc",
+        "00-11-22-AA-BB-CC",
+        "001122aabbcc",
+        "00:11:22:AA:BB:CC",
+    ],
+)
+def test_normalize_mac(mac_address: str) -> None:
+    """Test MAC addresses are normalized to upper-case, colon separated form."""
+    assert _normalize_mac(mac_address) == "00:11:22:AA:BB:CC"
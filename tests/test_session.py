@@ -0,0 +1,69 @@
+"""Tests for the Volcano Hybrid session tracking."""
+from datetime import datetime, timedelta
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from custom_components.volcano_hybrid import (
+    TEMP_REACHED_CONFIRMATIONS,
+    VolcanoCoordinator,
+    _SessionState,
+)
+
+
+def _queued_events(coordinator: VolcanoCoordinator) -> list[str]:
+    """Drain the session event queue and return the event types."""
+    events = []
+    while not coordinator._event_queue.empty():
+        events.append(coordinator._event_queue.get_nowait()["type"])
+    return events
+
+
+async def test_session_start_and_end(
+    hass: HomeAssistant, mock_config_entry: ConfigEntry
+) -> None:
+    """Test heat on starts a session and heat off ends it."""
+    coordinator = VolcanoCoordinator(hass, "00:11:22:33:44:55", mock_config_entry)
+    now = datetime.now()
+
+    coordinator._update_session_state(now, True, False, 20, 180)
+    assert coordinator._session.state is _SessionState.HEATING
+    assert coordinator.sessions_today == 1
+    assert coordinator.total_sessions == 1
+    assert _queued_events(coordinator) == ["session_started"]
+
+    # Staying on does not start another session
+    coordinator._update_session_state(now, True, False, 25, 180)
+    assert coordinator.total_sessions == 1
+    assert _queued_events(coordinator) == []
+
+    coordinator._update_session_state(now + timedelta(minutes=5), False, False, 150, 180)
+    assert coordinator._session.state is _SessionState.IDLE
+    assert coordinator.last_session_duration is not None
+    assert _queued_events(coordinator) == ["session_ended"]
+
+
+async def test_target_reached_needs_consecutive_polls(
+    hass: HomeAssistant, mock_config_entry: ConfigEntry
+) -> None:
+    """Test the target is only reported reached after consecutive polled samples."""
+    coordinator = VolcanoCoordinator(hass, "00:11:22:33:44:55", mock_config_entry)
+    now = datetime.now()
+    coordinator._update_session_state(now, True, False, 20, 180)
+    _queued_events(coordinator)
+
+    # Pushed notifications don't count towards the confirmations
+    for _ in range(TEMP_REACHED_CONFIRMATIONS):
+        coordinator._update_session_state(now, True, False, 179, 180, polled=False)
+    assert coordinator._session.state is _SessionState.HEATING
+
+    # A sample below the margin resets the streak
+    for _ in range(TEMP_REACHED_CONFIRMATIONS - 1):
+        coordinator._update_session_state(now, True, False, 179, 180)
+    coordinator._update_session_state(now, True, False, 150, 180)
+    assert coordinator._session.state is _SessionState.HEATING
+
+    for _ in range(TEMP_REACHED_CONFIRMATIONS):
+        coordinator._update_session_state(now, True, False, 179, 180)
+    assert coordinator._session.state is _SessionState.READY
+    assert _queued_events(coordinator) == ["temperature_reached"]
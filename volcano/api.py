@@ -3,11 +3,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import struct
-from typing import Any, Callable
+import random
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, Iterable
 
 from bleak import BleakClient
-from bleak.exc import BleakError
+from bleak.exc import BleakDBusError, BleakDeviceNotFoundError, BleakError
 from homeassistant.core import HomeAssistant
 from homeassistant.components import bluetooth
 
@@ -25,15 +27,100 @@ from ..const import (
     CHAR_STATUS_REGISTER,
     CHAR_TARGET_TEMP,
     CHAR_VOLCANO_FIRMWARE_VERSION,
+    MAX_BRIGHTNESS,
+    MIN_BRIGHTNESS,
+    VOLCANO_CONTROL_SERVICE_UUID,
+    VOLCANO_SERVICE_UUID,
 )
 
-from .exceptions import VolcanoConnectionError
+from .exceptions import VolcanoConnectionError, VolcanoTimeoutError
 
 _LOGGER = logging.getLogger(__name__)
 
 # Define correct masks based on user feedback
 STATUS_HEAT_ON_MASK = 0x0020  # Bit 5 for Heat
 STATUS_FAN_ON_MASK = 0x2000   # Bit 13 for Fan
+# The status bits this integration tracks, other bits are ignored
+STATUS_STATE_MASK = STATUS_HEAT_ON_MASK | STATUS_FAN_ON_MASK
+
+# Reconnect backoff between attempts: base * 2**attempt seconds, capped, plus jitter
+RECONNECT_BACKOFF_BASE = 2
+RECONNECT_BACKOFF_MAX = 30
+RECONNECT_BACKOFF_JITTER = 1.0
+
+# BlueZ D-Bus error names (BleakDBusError.dbus_error) that another attempt
+# cannot fix; every other connect error is retried
+PERMANENT_DBUS_ERRORS = frozenset({
+    "org.bluez.Error.AuthenticationFailed",
+    "org.bluez.Error.AuthenticationRejected",
+    "org.bluez.Error.NotPermitted",
+    "org.bluez.Error.NotSupported",
+})
+
+# Errors a GATT operation can raise, wrapped as VolcanoConnectionError
+BLE_ERRORS = (BleakError, asyncio.TimeoutError, OSError)
+
+# A GATT operation failing with BleakError is retried this often, this far apart
+GATT_RETRY_ATTEMPTS = 2
+GATT_RETRY_DELAY = 0.05
+
+# Seconds a GATT read, write, (un)subscribe or disconnect may take before
+# it is abandoned; connect relies on bleak's own connection timeout
+GATT_OP_TIMEOUT = 5.0
+
+# Every characteristic used lives in one of these; discovery skips the rest
+GATT_SERVICES = (VOLCANO_SERVICE_UUID, VOLCANO_CONTROL_SERVICE_UUID)
+
+
+class _Relay(Enum):
+    """Relays switched through dedicated on and off characteristics."""
+
+    HEAT = "heat"
+    FAN = "fan"
+
+
+# On and off characteristics of each relay
+RELAY_CHARS: dict[_Relay, tuple[str, str]] = {
+    _Relay.HEAT: (CHAR_HEAT_ON, CHAR_HEAT_OFF),
+    _Relay.FAN: (CHAR_FAN_ON, CHAR_FAN_OFF),
+}
+
+# Payloads written to the heat/fan on and off characteristics
+CMD_ON = b"\x01"
+CMD_OFF = b"\x00"
+
+# Screen brightness payloads, indexed by percent
+BRIGHTNESS_PAYLOADS = tuple(bytes((level,)) for level in range(MAX_BRIGHTNESS + 1))
+
+# Accepted target temperature range in the device's tenths of a degree
+TEMP_RAW_MIN = 400
+TEMP_RAW_MAX = 2300
+
+# Seconds a heat/fan command waits for the status notification confirming it
+STATUS_CONFIRM_TIMEOUT = 0.25
+
+# Seconds a batched live state read is reused instead of going back to the device
+LIVE_STATE_MAX_AGE = 0.5
+
+# Seconds a notified current temperature is trusted without reading it back
+TEMPERATURE_NOTIFICATION_MAX_AGE = 5.0
+
+
+def _is_permanent_connect_error(err: BleakError) -> bool:
+    """Return True for connect failures that retrying cannot fix.
+
+    The backend no longer knowing the device, or BlueZ rejecting the
+    connection outright; unknown errors count as transient.
+    """
+    if isinstance(err, BleakDeviceNotFoundError):
+        return True
+    return isinstance(err, BleakDBusError) and err.dbus_error in PERMANENT_DBUS_ERRORS
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode a NUL-padded string characteristic."""
+    return data.rstrip(b"\x00").decode("utf-8", "replace").strip()
+
 
 class VolcanoAPI:
     """BLE API for Volcano Hybrid."""
@@ -41,24 +128,58 @@ class VolcanoAPI:
     def __init__(self, hass: HomeAssistant, mac_address: str) -> None:
         """Initialize the Volcano API."""
         self._hass = hass
-        self._mac_address = mac_address
+        self._mac_address = mac_address.upper()  # Bluetooth registry lookups are upper-case
         self._client: BleakClient | None = None
         self._is_connected = False
         self._disconnect_callback: Callable[[], None] | None = None
+        self._status_update_callback: Callable[[], None] | None = None
+        self._status_update_pending = False
+        self._notifications_active = False
         self._current_temperature = 0.0
         self._target_temperature = 0.0
         self._heat_on = False
         self._fan_on = False
+        self._live_state_read_at: float | None = None
+        # Task running the connection attempts, cancelled by disconnect()
+        self._connect_task: asyncio.Task | None = None
+        self._temperature_notified_at: float | None = None
+        self._target_notified_at: float | None = None
+        self._status_notified_at: float | None = None
+        # Set once temperatures and status have been read since connecting
+        self._state_seeded = False
+        # Fixed for the life of the device, read once and kept across reconnects
+        self._ble_firmware_version: str | None = None
+        self._volcano_firmware_version: str | None = None
+        self._serial_number: str | None = None
+        # Heat/fan bits of the last status notification, repeats are ignored
+        self._last_status_bits: int | None = None
+        # Set whenever a status register notification has been processed
+        self._status_event = asyncio.Event()
+        # Serializes GATT operations so callers can safely gather reads
+        self._lock = asyncio.Lock()
 
     async def connect(self, max_retries: int = 3) -> bool:
-        """Connect to the Volcano device."""
+        """Connect to the Volcano device.
+
+        The attempts run in their own task so disconnect() can cancel them
+        without touching the caller. A second caller joins the attempt
+        already in flight instead of starting another one.
+        """
+        task = self._connect_task
+        if task is None or task.done():
+            task = self._connect_task = asyncio.create_task(self._connect(max_retries))
+        # A cancelled caller leaves the attempt to the others or to disconnect()
+        return await asyncio.shield(task)
+
+    async def _connect(self, max_retries: int) -> bool:
+        """Run the connection attempts for connect()."""
         for attempt in range(max_retries):
             try:
                 _LOGGER.debug("Connecting to Volcano at %s (attempt %d/%d)", self._mac_address, attempt + 1, max_retries)
                 
                 # Use Home Assistant's Bluetooth integration to get BLE device
                 ble_device = bluetooth.async_ble_device_from_address(
-                    self._hass, self._mac_address.upper(), connectable=True
+                    self._hass, self._mac_address, connectable=True
                 )
                 if not ble_device:
                     _LOGGER.error("Bluetooth device not found or not connectable: %s", self._mac_address)
@@ -67,6 +188,7 @@ class VolcanoAPI:
                 self._client = BleakClient(
                     ble_device,  # Use BLE device object instead of raw MAC address
                     disconnected_callback=self._handle_disconnect,
+                    services=GATT_SERVICES,
                 )
                 
                 await self._client.connect()
@@ -82,6 +204,9 @@ class VolcanoAPI:
             except BleakError as err:
                 _LOGGER.error("Failed to connect to Volcano (attempt %d/%d): %s", attempt + 1, max_retries, err)
                 self._is_connected = False
+                if _is_permanent_connect_error(err):
+                    await self._discard_client()
+                    raise VolcanoConnectionError(f"Failed to connect to Volcano: {err}") from err
                 if attempt == max_retries - 1:  # Last attempt
                     raise VolcanoConnectionError(f"Failed to connect to Volcano after {max_retries} attempts: {err}") from err
                     
@@ -92,44 +217,69 @@ class VolcanoAPI:
                     raise VolcanoConnectionError(f"Unexpected connection error after {max_retries} attempts: {err}") from err
                     
             # Clean up client on failed attempts
-            if self._client:
-                try:
-                    if self._client.is_connected:
-                        await self._client.disconnect()
-                except Exception:
-                    pass  # Ignore cleanup errors
-                finally:
-                    self._client = None
+            await self._discard_client()
                     
-            # Wait a bit before retrying
+            # Back off before retrying, jittered so several devices don't retry in lockstep
             if attempt < max_retries - 1:
-                await asyncio.sleep(2)
+                await asyncio.sleep(
+                    min(RECONNECT_BACKOFF_MAX, RECONNECT_BACKOFF_BASE * 2**attempt)
+                    + random.uniform(0, RECONNECT_BACKOFF_JITTER)
+                )
                 
         return False
 
+    async def _discard_client(self) -> None:
+        """Drop the client left behind by a failed connection attempt."""
+        if self._client:
+            try:
+                if self._client.is_connected:
+                    await asyncio.wait_for(self._client.disconnect(), GATT_OP_TIMEOUT)
+            except Exception:
+                pass  # Ignore cleanup errors
+            finally:
+                self._client = None
+
     async def disconnect(self) -> None:
         """Disconnect from the Volcano device."""
+        # Don't let a retry loop still in flight bring the connection back
+        connect_task = self._connect_task
+        if connect_task is not None and not connect_task.done():
+            connect_task.cancel()
+            await asyncio.gather(connect_task, return_exceptions=True)
+
         try:
             if self._client and self._client.is_connected:
                 # Stop notifications before disconnecting
                 try:
-                    await self._client.stop_notify(CHAR_CURRENT_TEMP)
-                    await self._client.stop_notify(CHAR_STATUS_REGISTER)
+                    await asyncio.wait_for(
+                        asyncio.gather(
+                            self._client.stop_notify(CHAR_CURRENT_TEMP),
+                            self._client.stop_notify(CHAR_TARGET_TEMP),
+                            self._client.stop_notify(CHAR_STATUS_REGISTER),
+                        ),
+                        GATT_OP_TIMEOUT,
+                    )
                 except Exception as err:
                     _LOGGER.debug("Error stopping notifications during disconnect: %s", err)
                 
-                await self._client.disconnect()
+                await asyncio.wait_for(self._client.disconnect(), GATT_OP_TIMEOUT)
                 _LOGGER.debug("Disconnected from Volcano")
         except Exception as err:
             _LOGGER.error("Error during disconnect: %s", err)
         finally:
             self._is_connected = False
+            self._notifications_active = False
+            self._last_status_bits = None
+            self._state_seeded = False
             self._client = None
 
     def _handle_disconnect(self, client: BleakClient) -> None:
         """Handle disconnect callback."""
         _LOGGER.info("Volcano disconnected")
         self._is_connected = False
+        self._notifications_active = False
+        self._last_status_bits = None
+        self._state_seeded = False
         if self._disconnect_callback:
             self._disconnect_callback()
 
@@ -137,26 +287,115 @@ class VolcanoAPI:
         """Set disconnect callback."""
         self._disconnect_callback = callback
 
+    def set_status_update_callback(self, callback: Callable[[], None]) -> None:
+        """Set callback invoked when a notification changes device state."""
+        self._status_update_callback = callback
+
     async def _setup_notifications(self) -> None:
-        """Setup BLE notifications."""
+        """Subscribe to notifications, then seed the cache they keep current."""
         if not self._client:
             return
 
+        client = self._client
         try:
-            # Setup notifications for temperature and status updates
-            await self._client.start_notify(CHAR_CURRENT_TEMP, self._handle_temperature_notification)
-            await self._client.start_notify(CHAR_STATUS_REGISTER, self._handle_status_notification)
-            _LOGGER.debug("Notifications setup successfully")
+            # Setup notifications for temperature and status updates; the
+            # descriptor writes are independent so they go out together
+            await asyncio.wait_for(
+                asyncio.gather(
+                    client.start_notify(CHAR_CURRENT_TEMP, self._handle_temperature_notification),
+                    client.start_notify(CHAR_TARGET_TEMP, self._handle_target_temperature_notification),
+                    client.start_notify(CHAR_STATUS_REGISTER, self._handle_status_notification),
+                ),
+                GATT_OP_TIMEOUT,
+            )
         except Exception as err:
+            self._notifications_active = False
             _LOGGER.error("Failed to setup notifications: %s", err)
             # Don't raise the error - notifications are optional for basic functionality
+            return
+
+        self._notifications_active = True
+        _LOGGER.debug("Notifications setup successfully")
+
+        # Target and status only notify on change, so read their current
+        # values once; polls rely on this cache while notifications are active
+        started = time.monotonic()
+        try:
+            current_data, target_data, status_data = await self.read_multiple(
+                (CHAR_CURRENT_TEMP, CHAR_TARGET_TEMP, CHAR_STATUS_REGISTER)
+            )
+        except (*BLE_ERRORS, VolcanoConnectionError) as err:
+            # Subscriptions stay live; the coordinator does a full read instead
+            _LOGGER.warning("Failed to read initial device state: %s", err)
+            return
+
+        # A value notified while the read was in flight is newer than the read
+        def _stale(notified_at: float | None) -> bool:
+            return notified_at is not None and notified_at >= started
+
+        self._apply_live_state(
+            b"" if _stale(self._temperature_notified_at) else current_data,
+            b"" if _stale(self._target_notified_at) else target_data,
+            b"" if _stale(self._status_notified_at) else status_data,
+        )
 
     def _handle_temperature_notification(self, sender: int, data: bytearray) -> None:
         """Handle temperature notification."""
         if len(data) >= 2:
-            temp = struct.unpack("<H", data[:2])[0] / 10.0
+            self._temperature_notified_at = time.monotonic()
+            temp = int.from_bytes(data[:2], "little") / 10.0
+            if temp == self._current_temperature:
+                return
             self._current_temperature = temp
-            _LOGGER.debug("Temperature updated: %s°C", temp)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Temperature updated: %s°C", temp)
+            self._schedule_status_update()
+
+    def _handle_target_temperature_notification(self, sender: int, data: bytearray) -> None:
+        """Handle target temperature notification."""
+        if len(data) >= 2:
+            self._target_notified_at = time.monotonic()
+            temp = int.from_bytes(data[:2], "little") / 10.0
+            if temp == self._target_temperature:
+                return
+            self._target_temperature = temp
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Target temperature updated: %s°C", temp)
+            self._schedule_status_update()
+
+    def _schedule_status_update(self) -> None:
+        """Run the status callback once on the next loop tick.
+
+        Notifications arriving in the same tick only update the cached values,
+        so a burst costs one coordinator update instead of one per packet.
+        """
+        if self._status_update_callback and not self._status_update_pending:
+            self._status_update_pending = True
+            self._hass.loop.call_soon(self._flush_status_update)
+
+    def _flush_status_update(self) -> None:
+        """Deliver the coalesced status update."""
+        self._status_update_pending = False
+        if self._status_update_callback:
+            self._status_update_callback()
+
+    def _apply_status_word(self, raw: int, source: str) -> bool:
+        """Store heat and fan state from a status register word.
+
+        Returns True if either changed.
+        """
+        new_heat_on = raw & STATUS_HEAT_ON_MASK != 0
+        new_fan_on = raw & STATUS_FAN_ON_MASK != 0
+        heat_changed = new_heat_on != self._heat_on
+        fan_changed = new_fan_on != self._fan_on
+        if (heat_changed or fan_changed) and _LOGGER.isEnabledFor(logging.DEBUG):
+            if heat_changed:
+                _LOGGER.debug("%s: Heat state changed from %s to %s.", source, self._heat_on, new_heat_on)
+            if fan_changed:
+                _LOGGER.debug("%s: Fan state changed from %s to %s.", source, self._fan_on, new_fan_on)
+        self._heat_on = new_heat_on
+        self._fan_on = new_fan_on
+        return heat_changed or fan_changed
 
     def _handle_status_notification(self, sender: int, data: bytearray) -> None:
         """Handle status notifications from the device."""
@@ -165,250 +404,353 @@ class VolcanoAPI:
             return
 
         if len(data) >= 2:  # Expecting at least 2 bytes for the 16-bit status
+            self._status_notified_at = time.monotonic()
             # Decode the 16-bit little-endian status register
-            decoded_status = data[0] | (data[1] << 8)
-            _LOGGER.debug(
-                "Received status notification. Raw data: %s, Decoded: %s. API state before: Heat=%s, Fan=%s",
-                data.hex(), hex(decoded_status), self._heat_on, self._fan_on
-            )
-
-            new_heat_on = bool(decoded_status & STATUS_HEAT_ON_MASK)
-            new_fan_on = bool(decoded_status & STATUS_FAN_ON_MASK)
+            decoded_status = int.from_bytes(data[:2], "little")
+            # Other register bits can change without affecting heat or fan
+            state_bits = decoded_status & STATUS_STATE_MASK
+            if state_bits == self._last_status_bits:
+                return
+            self._last_status_bits = state_bits
+            # Checked once; the hex() arguments below are built eagerly
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
+            if debug:
+                _LOGGER.debug(
+                    "Received status notification. Raw data: %s, Decoded: %s. API state before: Heat=%s, Fan=%s",
+                    data.hex(), hex(decoded_status), self._heat_on, self._fan_on
+                )
 
-            heat_changed = new_heat_on != self._heat_on
-            fan_changed = new_fan_on != self._fan_on
+            changed = self._apply_status_word(decoded_status, "Notification")
 
-            if heat_changed:
-                _LOGGER.debug("Notification: Heat state changed from %s to %s.", self._heat_on, new_heat_on)
-                self._heat_on = new_heat_on
-            
-            if fan_changed:
-                _LOGGER.debug("Notification: Fan state changed from %s to %s.", self._fan_on, new_fan_on)
-                self._fan_on = new_fan_on
+            # Wake any command waiting for its confirmation
+            self._status_event.set()
 
             # If any relevant state changed, trigger the callback.
             # This ensures HA gets all updates if the notification contained more than just heat/fan.
-            if heat_changed or fan_changed:
-                _LOGGER.debug(
-                    "Calling status update callback. New API state: Heat=%s, Fan=%s",
-                    self._heat_on, self._fan_on
-                )
-                self._status_update_callback()
-            else:
+            if changed:
+                if debug:
+                    _LOGGER.debug(
+                        "Calling status update callback. New API state: Heat=%s, Fan=%s",
+                        self._heat_on, self._fan_on
+                    )
+                self._schedule_status_update()
+            elif debug:
                 _LOGGER.debug("No change in heat or fan state from notification. API state: Heat=%s, Fan=%s", self._heat_on, self._fan_on)
         else:
             _LOGGER.warning("Received status notification with insufficient data length: %d bytes, data: %s", len(data), data.hex())
 
-    async def _update_status_from_register(self) -> None:
-        """Update heat and fan status from device status register during polling."""
-        if not self.is_connected:
-            _LOGGER.debug("Not connected, skipping polled status update from register.")
-            return
+    def _ensure_connected(self) -> None:
+        """Raise unless the device is connected."""
+        if not self._is_connected:
+            raise VolcanoConnectionError("Device not connected")
 
-        try:
-            status_data = await self._client.read_gatt_char(CHAR_STATUS_REGISTER)
-            if status_data and len(status_data) >= 2: # Expecting at least 2 bytes
-                # Decode the 16-bit little-endian status register
-                decoded_status = status_data[0] | (status_data[1] << 8)
-                _LOGGER.debug(
-                    "Read status register (polling). Raw data: %s, Decoded: %s. API state before: Heat=%s, Fan=%s",
-                    status_data.hex(), hex(decoded_status), self._heat_on, self._fan_on
-                )
+    def _require_client(self) -> BleakClient:
+        """Return the BLE client, or raise if it went away mid-operation."""
+        if self._client is None:
+            raise VolcanoConnectionError("Device not connected")
+        return self._client
 
-                new_heat_on = bool(decoded_status & STATUS_HEAT_ON_MASK)
-                new_fan_on = bool(decoded_status & STATUS_FAN_ON_MASK)
+    async def _retry_gatt(self, op: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """Run a GATT operation, retrying transient BleakErrors before giving up.
 
-                heat_changed = new_heat_on != self._heat_on
-                fan_changed = new_fan_on != self._fan_on
+        Called with the lock held. A short retry is far cheaper than the full
+        reconnect a propagated error leads to. Each attempt is bounded by
+        GATT_OP_TIMEOUT so a hung link cannot hold the lock indefinitely;
+        notification setup and disconnect apply the same limit themselves.
+        """
+        for attempt in range(GATT_RETRY_ATTEMPTS):
+            try:
+                return await asyncio.wait_for(op(*args), GATT_OP_TIMEOUT)
+            except asyncio.TimeoutError as err:
+                # A hung link will not recover within a retry, give the lock back
+                raise VolcanoTimeoutError(
+                    f"GATT operation timed out after {GATT_OP_TIMEOUT} seconds"
+                ) from err
+            except BleakError as err:
+                # The link state of the client itself, so reads made while
+                # connect() seeds the cache are retried too
+                client = self._client
+                if attempt == GATT_RETRY_ATTEMPTS - 1 or client is None or not client.is_connected:
+                    raise
+                _LOGGER.debug("Retrying GATT operation after error: %s", err)
+                await asyncio.sleep(GATT_RETRY_DELAY)
+
+    async def _read_char(self, char_uuid: str) -> bytearray:
+        """Read a characteristic, serializing access to the BLE client."""
+        async with self._lock:
+            return await self._retry_gatt(self._require_client().read_gatt_char, char_uuid)
+
+    async def read_multiple(self, char_uuids: Iterable[str]) -> list[bytearray]:
+        """Read several characteristics back to back under one lock hold.
+
+        bleak does not expose the ATT Read Multiple request on every backend,
+        so the reads are queued together without releasing the client to
+        other callers in between.
+        """
+        async with self._lock:
+            client = self._require_client()
+            return [await self._retry_gatt(client.read_gatt_char, uuid) for uuid in char_uuids]
+
+    async def _write_char(self, char_uuid: str, data: bytes, response: bool = True) -> None:
+        """Write a characteristic, serializing access to the BLE client.
+
+        response=False skips the ATT acknowledgement, but only when the
+        characteristic advertises write-without-response.
+        """
+        async with self._lock:
+            client = self._require_client()
+            if not response:
+                char = client.services.get_characteristic(char_uuid)
+                response = char is None or "write-without-response" not in char.properties
+            await self._retry_gatt(client.write_gatt_char, char_uuid, data, response)
+
+    async def get_current_temperature(self) -> float:
+        """Get current temperature."""
+        self._ensure_connected()
+
+        # Notifications keep the value current, only read when they go quiet
+        if (
+            self._temperature_notified_at is not None
+            and time.monotonic() - self._temperature_notified_at
+            < TEMPERATURE_NOTIFICATION_MAX_AGE
+        ):
+            return self._current_temperature
 
-                if heat_changed:
-                    _LOGGER.debug("Polling: Heat state changed from %s to %s.", self._heat_on, new_heat_on)
-                    self._heat_on = new_heat_on
-                
-                if fan_changed:
-                    _LOGGER.debug("Polling: Fan state changed from %s to %s.", self._fan_on, new_fan_on)
-                    self._fan_on = new_fan_on
-                
-                if heat_changed or fan_changed:
-                    _LOGGER.debug("Polled status update resulted in API state change. New API state: Heat=%s, Fan=%s", self._heat_on, self._fan_on)
-                else:
-                    _LOGGER.debug("Polled status update did not change API state. API state: Heat=%s, Fan=%s", self._heat_on, self._fan_on)
-            else:
-                _LOGGER.warning("Failed to read valid status register data or data is too short during polling. Length: %s, Data: %s", len(status_data) if status_data else "None", status_data.hex() if status_data else "None")
-        except Exception as err:
-            _LOGGER.error("Error reading or parsing status register during polling: %s", err)
+        try:
+            data = await self._read_char(CHAR_CURRENT_TEMP)
+            self._current_temperature = int.from_bytes(data[:2], "little") / 10.0
+            return self._current_temperature
+        except BLE_ERRORS as err:
+            _LOGGER.error("Failed to read current temperature: %s", err)
+            raise VolcanoConnectionError(f"Failed to read current temperature: {err}") from err
+
+    async def get_target_temperature(self) -> float:
+        """Get target temperature."""
+        self._ensure_connected()
+
+        try:
+            data = await self._read_char(CHAR_TARGET_TEMP)
+            self._target_temperature = int.from_bytes(data[:2], "little") / 10.0
+            return self._target_temperature
+        except BLE_ERRORS as err:
+            _LOGGER.error("Failed to read target temperature: %s", err)
+            raise VolcanoConnectionError(f"Failed to read target temperature: {err}") from err
 
     async def set_target_temperature(self, temperature: float) -> None:
         """Set target temperature."""
-        if not self.is_connected:
-            raise VolcanoConnectionError("Device not connected")
+        self._ensure_connected()
         
-        if not 40 <= temperature <= 230:
+        # The device works in tenths, so quantize once and range check the int
+        temp_value = round(temperature * 10)
+        if not TEMP_RAW_MIN <= temp_value <= TEMP_RAW_MAX:
             raise ValueError("Temperature must be between 40°C and 230°C")
         
         try:
-            temp_value = int(temperature * 10)
-            data = struct.pack("<H", temp_value)
-            await self._client.write_gatt_char(CHAR_TARGET_TEMP, data)
-            self._target_temperature = temperature
+            await self._write_char(CHAR_TARGET_TEMP, temp_value.to_bytes(2, "little"))
+            self._target_temperature = temp_value / 10.0
             _LOGGER.debug("Target temperature set to %s°C", temperature)
-        except Exception as err:
+        except BLE_ERRORS as err:
             _LOGGER.error("Failed to set target temperature: %s", err)
             raise VolcanoConnectionError(f"Failed to set temperature: {err}") from err
 
+    async def set_preset(self, temperature: float) -> None:
+        """Set target temperature and turn heat on in one BLE batch."""
+        self._ensure_connected()
+
+        temp_value = round(temperature * 10)
+        if not TEMP_RAW_MIN <= temp_value <= TEMP_RAW_MAX:
+            raise ValueError("Temperature must be between 40°C and 230°C")
+
+        try:
+            data = temp_value.to_bytes(2, "little")
+            # Both writes are issued back to back under a single lock hold
+            async with self._lock:
+                client = self._require_client()
+                await self._retry_gatt(client.write_gatt_char, CHAR_TARGET_TEMP, data)
+                await self._retry_gatt(client.write_gatt_char, CHAR_HEAT_ON, CMD_ON)
+            self._target_temperature = temp_value / 10.0
+            # One status notification confirms the whole batch
+            if not await self._await_status(lambda: self._heat_on):
+                self._heat_on = True  # Optimistic update, no confirmation in time
+                self._last_status_bits = None
+            _LOGGER.debug("Preset applied: %s°C, heat on", temperature)
+        except BLE_ERRORS as err:
+            _LOGGER.error("Failed to apply preset: %s", err)
+            raise VolcanoConnectionError(f"Failed to apply preset: {err}") from err
+
+    @property
+    def _status_confirmed(self) -> bool:
+        """Whether heat/fan state comes from a notification, not a guess."""
+        return self._notifications_active and self._last_status_bits is not None
+
+    async def _await_status(self, confirmed: Callable[[], bool]) -> bool:
+        """Wait briefly for a status notification that satisfies confirmed."""
+        if not self._notifications_active:
+            return False
+
+        async def _wait() -> None:
+            while not confirmed():
+                self._status_event.clear()
+                await self._status_event.wait()
+
+        try:
+            await asyncio.wait_for(_wait(), STATUS_CONFIRM_TIMEOUT)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def _relay_on(self, relay: _Relay) -> bool:
+        """Return the cached state of a relay."""
+        if relay is _Relay.HEAT:
+            return self._heat_on
+        return self._fan_on
+
+    def _store_relay(self, relay: _Relay, on: bool) -> None:
+        """Store the state of a relay."""
+        if relay is _Relay.HEAT:
+            self._heat_on = on
+        else:
+            self._fan_on = on
+
+    async def _set_relay(self, relay: _Relay, on: bool) -> None:
+        """Switch the heat or fan relay and confirm it from the status register."""
+        self._ensure_connected()
+        action = f"turn {relay.value} {'on' if on else 'off'}"
+        # Notifications keep the cache authoritative, so a repeat is a no-op
+        if self._status_confirmed and self._relay_on(relay) is on:
+            return
+        on_char, off_char = RELAY_CHARS[relay]
+        try:
+            # The status notification confirms the write, so no ATT ack is needed
+            if on:
+                await self._write_char(on_char, CMD_ON, response=False)
+            else:
+                await self._write_char(off_char, CMD_OFF, response=False)
+            if not await self._await_status(lambda: self._relay_on(relay) is on):
+                self._store_relay(relay, on)  # Optimistic update, no confirmation in time
+                # Let the next notification correct us even if it repeats
+                self._last_status_bits = None
+            _LOGGER.debug("%s done. API state: Heat=%s, Fan=%s", action, self._heat_on, self._fan_on)
+        except BLE_ERRORS as err:
+            _LOGGER.error("Failed to %s: %s", action, err)
+            raise VolcanoConnectionError(f"Failed to {action}: {err}") from err
+
     async def set_heat_on(self) -> None:
         """Turn heat on."""
-        if not self.is_connected:
-            raise VolcanoConnectionError("Device not connected")
-        try:
-            # Assuming CHAR_HEAT_ON command and its payload are correct from previous discussions
-            await self._client.write_gatt_char(CHAR_HEAT_ON, b"\x01") 
-            self._heat_on = True # Optimistic update
-            await asyncio.sleep(0.1) 
-            _LOGGER.debug("Heat turned on (optimistic). API state: Heat=%s, Fan=%s", self._heat_on, self._fan_on)
-        except Exception as err:
-            _LOGGER.error("Failed to turn heat on: %s", err)
-            self._heat_on = False # Revert optimistic update on error
-            raise VolcanoConnectionError(f"Failed to turn heat on: {err}") from err
+        await self._set_relay(_Relay.HEAT, True)
 
     async def set_heat_off(self) -> None:
         """Turn heat off."""
-        if not self.is_connected:
-            raise VolcanoConnectionError("Device not connected")
-        try:
-            # Assuming CHAR_HEAT_OFF command and its payload are correct
-            await self._client.write_gatt_char(CHAR_HEAT_OFF, b"\x00") 
-            self._heat_on = False # Optimistic update
-            await asyncio.sleep(0.1)
-            _LOGGER.debug("Heat turned off (optimistic). API state: Heat=%s, Fan=%s", self._heat_on, self._fan_on)
-        except Exception as err:
-            _LOGGER.error("Failed to turn heat off: %s", err)
-            self._heat_on = True # Revert optimistic update on error
-            raise VolcanoConnectionError(f"Failed to turn heat off: {err}") from err
+        await self._set_relay(_Relay.HEAT, False)
 
     async def set_fan_on(self) -> None:
         """Turn fan on."""
-        if not self.is_connected:
-            raise VolcanoConnectionError("Device not connected")
-        try:
-            # Assuming CHAR_FAN_ON command and its payload are correct
-            await self._client.write_gatt_char(CHAR_FAN_ON, b"\x01")
-            self._fan_on = True # Optimistic update
-            await asyncio.sleep(0.1)
-            _LOGGER.debug("Fan turned on (optimistic). API state: Heat=%s, Fan=%s", self._heat_on, self._fan_on)
-        except Exception as err:
-            _LOGGER.error("Failed to turn fan on: %s", err)
-            self._fan_on = False # Revert optimistic update on error
-            raise VolcanoConnectionError(f"Failed to turn fan on: {err}") from err
+        await self._set_relay(_Relay.FAN, True)
 
     async def set_fan_off(self) -> None:
         """Turn fan off."""
-        if not self.is_connected:
-            raise VolcanoConnectionError("Device not connected")
-        try:
-            # Assuming CHAR_FAN_OFF command and its payload are correct
-            await self._client.write_gatt_char(CHAR_FAN_OFF, b"\x00")
-            self._fan_on = False # Optimistic update
-            await asyncio.sleep(0.1)
-            _LOGGER.debug("Fan turned off (optimistic). API state: Heat=%s, Fan=%s", self._heat_on, self._fan_on)
-        except Exception as err:
-            _LOGGER.error("Failed to turn fan off: %s", err)
-            self._fan_on = True # Revert optimistic update on error
-            raise VolcanoConnectionError(f"Failed to turn fan off: {err}") from err
+        await self._set_relay(_Relay.FAN, False)
 
     async def set_screen_brightness(self, brightness: int) -> None:
         """Set screen brightness."""
-        if not self.is_connected:
-            raise VolcanoConnectionError("Device not connected")
+        self._ensure_connected()
         
-        if not 0 <= brightness <= 100:
+        if not MIN_BRIGHTNESS <= brightness <= MAX_BRIGHTNESS:
             raise ValueError("Brightness must be between 0 and 100")
         
         try:
-            await self._client.write_gatt_char(CHAR_SCREEN_BRIGHTNESS, bytes([brightness]))
+            await self._write_char(CHAR_SCREEN_BRIGHTNESS, BRIGHTNESS_PAYLOADS[brightness], response=False)
             _LOGGER.debug("Screen brightness set to %s%%", brightness)
-        except Exception as err:
+        except BLE_ERRORS as err:
             _LOGGER.error("Failed to set screen brightness: %s", err)
             raise VolcanoConnectionError(f"Failed to set brightness: {err}") from err
 
     async def get_ble_firmware_version(self) -> str:
         """Get BLE firmware version."""
-        if not self.is_connected:
-            raise VolcanoConnectionError("Device not connected")
+        self._ensure_connected()
         
+        if self._ble_firmware_version is not None:
+            return self._ble_firmware_version
+
         try:
-            data = await self._client.read_gatt_char(CHAR_BLE_FIRMWARE_VERSION)
-            return data.decode("utf-8").strip()
-        except Exception as err:
+            data = await self._read_char(CHAR_BLE_FIRMWARE_VERSION)
+            self._ble_firmware_version = _decode_text(data)
+            return self._ble_firmware_version
+        except BLE_ERRORS as err:
             _LOGGER.error("Failed to read BLE firmware version: %s", err)
             raise VolcanoConnectionError(f"Failed to read BLE firmware version: {err}") from err
 
     async def get_volcano_firmware_version(self) -> str:
         """Get Volcano firmware version."""
-        if not self.is_connected:
-            raise VolcanoConnectionError("Device not connected")
+        self._ensure_connected()
         
+        if self._volcano_firmware_version is not None:
+            return self._volcano_firmware_version
+
         try:
-            data = await self._client.read_gatt_char(CHAR_VOLCANO_FIRMWARE_VERSION)
-            return data.decode("utf-8").strip()
-        except Exception as err:
+            data = await self._read_char(CHAR_VOLCANO_FIRMWARE_VERSION)
+            self._volcano_firmware_version = _decode_text(data)
+            return self._volcano_firmware_version
+        except BLE_ERRORS as err:
             _LOGGER.error("Failed to read Volcano firmware version: %s", err)
             raise VolcanoConnectionError(f"Failed to read Volcano firmware version: {err}") from err
 
     async def get_serial_number(self) -> str:
         """Get device serial number."""
-        if not self.is_connected:
-            raise VolcanoConnectionError("Device not connected")
+        self._ensure_connected()
         
+        if self._serial_number is not None:
+            return self._serial_number
+
         try:
-            data = await self._client.read_gatt_char(CHAR_SERIAL_NUMBER)
-            return data.decode("utf-8").strip()
-        except Exception as err:
+            data = await self._read_char(CHAR_SERIAL_NUMBER)
+            self._serial_number = _decode_text(data)
+            return self._serial_number
+        except BLE_ERRORS as err:
             _LOGGER.error("Failed to read serial number: %s", err)
             raise VolcanoConnectionError(f"Failed to read serial number: {err}") from err
 
     async def get_hours_of_operation(self) -> int:
         """Get hours of operation."""
-        if not self.is_connected:
-            raise VolcanoConnectionError("Device not connected")
+        self._ensure_connected()
         
         try:
-            data = await self._client.read_gatt_char(CHAR_HOURS_OF_OPERATION)
-            return struct.unpack("<H", data[:2])[0]
-        except Exception as err:
+            data = await self._read_char(CHAR_HOURS_OF_OPERATION)
+            return int.from_bytes(data[:2], "little")
+        except BLE_ERRORS as err:
             _LOGGER.error("Failed to read hours of operation: %s", err)
             raise VolcanoConnectionError(f"Failed to read hours of operation: {err}") from err
 
     async def get_minutes_of_operation(self) -> int:
         """Get minutes of operation."""
-        if not self.is_connected:
-            raise VolcanoConnectionError("Device not connected")
+        self._ensure_connected()
         
         try:
-            data = await self._client.read_gatt_char(CHAR_MINUTES_OF_OPERATION)
-            return struct.unpack("<H", data[:2])[0]
-        except Exception as err:
+            data = await self._read_char(CHAR_MINUTES_OF_OPERATION)
+            return int.from_bytes(data[:2], "little")
+        except BLE_ERRORS as err:
             _LOGGER.error("Failed to read minutes of operation: %s", err)
             raise VolcanoConnectionError(f"Failed to read minutes of operation: {err}") from err
 
-    async def get_device_state(self) -> dict[str, Any]:
-        """Get current device state by reading from device."""
-        if not self.is_connected:
-            raise VolcanoConnectionError("Device not connected")
-        
+    async def get_operation_time(self) -> tuple[int, int]:
+        """Get hours and minutes of operation in one batched read."""
+        self._ensure_connected()
+
         try:
-            # Read the status register to get real-time heat/fan state
-            status_data = await self._client.read_gatt_char(CHAR_STATUS_REGISTER)
-            if len(status_data) >= 1:
-                status = status_data[0]
-                # Update cached states with fresh data
-                self._heat_on = bool(status & 0x01)
-                self._fan_on = bool(status & 0x02)
-                _LOGGER.debug("Status register read - Heat: %s, Fan: %s", self._heat_on, self._fan_on)
-        except Exception as err:
-            _LOGGER.error("Failed to read status register: %s", err)
-            # Fall back to cached state if read fails
-        
+            hours_data, minutes_data = await self.read_multiple(
+                (CHAR_HOURS_OF_OPERATION, CHAR_MINUTES_OF_OPERATION)
+            )
+        except BLE_ERRORS as err:
+            _LOGGER.error("Failed to read operation time: %s", err)
+            raise VolcanoConnectionError(f"Failed to read operation time: {err}") from err
+
+        return (
+            int.from_bytes(hours_data[:2], "little"),
+            int.from_bytes(minutes_data[:2], "little"),
+        )
+
+    def _state_snapshot(self) -> dict[str, Any]:
+        """Return the cached device state."""
         return {
             "current_temperature": self._current_temperature,
             "target_temperature": self._target_temperature,
@@ -417,7 +759,70 @@ class VolcanoAPI:
             "connected": self._is_connected,
         }
 
+    async def get_live_state(self) -> dict[str, Any]:
+        """Get temperatures and heat/fan status in a single batched read."""
+        self._ensure_connected()
+
+        # A read this recent is still current; writes and notifications since
+        # then have already updated the cached values
+        if (
+            self._live_state_read_at is not None
+            and time.monotonic() - self._live_state_read_at < LIVE_STATE_MAX_AGE
+        ):
+            return self._state_snapshot()
+
+        try:
+            current_data, target_data, status_data = await self.read_multiple(
+                (CHAR_CURRENT_TEMP, CHAR_TARGET_TEMP, CHAR_STATUS_REGISTER)
+            )
+        except BLE_ERRORS as err:
+            _LOGGER.error("Failed to read device state: %s", err)
+            raise VolcanoConnectionError(f"Failed to read device state: {err}") from err
+
+        self._apply_live_state(current_data, target_data, status_data)
+        return self._state_snapshot()
+
+    def _apply_live_state(
+        self, current_data: bytes, target_data: bytes, status_data: bytes
+    ) -> None:
+        """Store temperatures and heat/fan status read from the device."""
+        if len(current_data) >= 2:
+            self._current_temperature = int.from_bytes(current_data[:2], "little") / 10.0
+        if len(target_data) >= 2:
+            self._target_temperature = int.from_bytes(target_data[:2], "little") / 10.0
+        if len(status_data) >= 2:
+            # Decode the 16-bit little-endian status register
+            self._apply_status_word(int.from_bytes(status_data[:2], "little"), "Read")
+        self._live_state_read_at = time.monotonic()
+        self._state_seeded = True
+
+    async def get_device_state(self) -> dict[str, Any]:
+        """Get current device state by reading from device."""
+        self._ensure_connected()
+
+        try:
+            return await self.get_live_state()
+        except VolcanoConnectionError as err:
+            _LOGGER.error("Failed to read device state: %s", err)
+            # Fall back to cached state if read fails
+            return self._state_snapshot()
+
     # Current state properties
+    @property
+    def is_connected(self) -> bool:
+        """Connection status."""
+        return self._is_connected
+
+    @property
+    def notifications_active(self) -> bool:
+        """Whether temperature and status notifications are subscribed."""
+        return self._notifications_active
+
+    @property
+    def state_seeded(self) -> bool:
+        """Whether cached state has been read from the device since connecting."""
+        return self._state_seeded
+
     @property
     def current_temperature(self) -> float:
         """Current temperature."""
@@ -437,42 +842,3 @@ class VolcanoAPI:
     def fan_on(self) -> bool:
         """Fan status."""
         return self._fan_on
-
-    async def _update_status_from_register(self) -> None:
-        """Update heat and fan status from device status register during polling."""
-        if not self.is_connected:
-            _LOGGER.debug("Not connected, skipping polled status update from register.")
-            return
-
-        try:
-            status_data = await self._client.read_gatt_char(CHAR_STATUS_REGISTER)
-            if status_data and len(status_data) >= 2: # Expecting at least 2 bytes
-                # Decode the 16-bit little-endian status register
-                decoded_status = status_data[0] | (status_data[1] << 8)
-                _LOGGER.debug(
-                    "Read status register (polling). Raw data: %s, Decoded: %s. API state before: Heat=%s, Fan=%s",
-                    status_data.hex(), hex(decoded_status), self._heat_on, self._fan_on
-                )
-
-                new_heat_on = bool(decoded_status & STATUS_HEAT_ON_MASK)
-                new_fan_on = bool(decoded_status & STATUS_FAN_ON_MASK)
-
-                heat_changed = new_heat_on != self._heat_on
-                fan_changed = new_fan_on != self._fan_on
-
-                if heat_changed:
-                    _LOGGER.debug("Polling: Heat state changed from %s to %s.", self._heat_on, new_heat_on)
-                    self._heat_on = new_heat_on
-                
-                if fan_changed:
-                    _LOGGER.debug("Polling: Fan state changed from %s to %s.", self._fan_on, new_fan_on)
-                    self._fan_on = new_fan_on
-                
-                if heat_changed or fan_changed:
-                    _LOGGER.debug("Polled status update resulted in API state change. New API state: Heat=%s, Fan=%s", self._heat_on, self._fan_on)
-                else:
-                    _LOGGER.debug("Polled status update did not change API state. API state: Heat=%s, Fan=%s", self._heat_on, self._fan_on)
-            else:
-                _LOGGER.warning("Failed to read valid status register data or data is too short during polling. Length: %s, Data: %s", len(status_data) if status_data else "None", status_data.hex() if status_data else "None")
-        except Exception as err:
-            _LOGGER.error("Error reading or parsing status register during polling: %s", err)
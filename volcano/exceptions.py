@@ -12,7 +12,7 @@ class VolcanoConnectionError(VolcanoError):
     """Exception for connection errors."""
 
 
-class VolcanoTimeoutError(VolcanoError):
+class VolcanoTimeoutError(VolcanoConnectionError):
     """Exception for timeout errors."""
 
 